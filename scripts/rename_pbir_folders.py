@@ -21,19 +21,117 @@ Setup:
 Usage:
   python rename_pbir_folders.py                                    # Auto-detect .Report folders
   python rename_pbir_folders.py /path/to/MyReport.Report          # Process specific report
+  python rename_pbir_folders.py --exclude archive                  # Skip folders named 'archive'
   python rename_pbir_folders.py --help                             # Show help
 
-Requirements: Python 3.7+ (no external dependencies)
+Requirements: Python 3.7+ (no external dependencies; uses ijson or orjson for faster JSON reads if installed)
 """
 
 import json
+import os
 import re
+import stat
+import string
 import sys
 import argparse
+import contextlib
+import errno
+import functools
+import threading
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
+try:
+    import ijson
+except ImportError:  # Optional: stream-parse JSON instead of loading whole files
+    ijson = None
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Optional: faster whole-file JSON parsing
+    _json_loads = json.loads
+
+
+# Folder processing is dominated by filesystem syscalls, which release the GIL
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# One lock per parent directory so sibling renames can't race on a target name
+_rename_locks = defaultdict(threading.Lock)
+_rename_locks_guard = threading.Lock()
+
+_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+_MULTI_UNDERSCORE = re.compile(r'_{2,}')
+_CLEAN_NAME = re.compile(r'[A-Za-z0-9]+(?:_[A-Za-z0-9]+)*')
+
+# ANSI colors: green, yellow, red, cyan, dim grey, reset. Only emitted when
+# writing to a terminal and NO_COLOR (https://no-color.org) is not set
+if sys.stdout.isatty() and 'NO_COLOR' not in os.environ:
+    _C = {'g': '\033[92m', 'y': '\033[93m', 'r': '\033[91m', 'c': '\033[96m', 'd': '\033[90m', 'e': '\033[0m'}
+else:
+    _C = dict.fromkeys('gyrcde', '')
+
+# Directories never worth descending into when auto-detecting reports
+_SKIP_DIRS = frozenset({
+    'node_modules', '.git', '.hg', '.svn', '__pycache__', 'venv', '.venv', 'env',
+    'dist', 'build', 'target', '.next', '.nuxt', '.cache',
+})
+
+
+class _LogBuffer:
+    """
+    Collects output lines so a whole report is written to stdout at once
+    
+    Workers each fill their own buffer; the main thread merges them in
+    order and flushes with a single write.
+    """
+    
+    __slots__ = ('lines',)
+    
+    def __init__(self):
+        self.lines = []
+    
+    def log(self, msg: str = '') -> None:
+        self.lines.append(msg)
+    
+    def extend(self, other: '_LogBuffer') -> None:
+        self.lines.extend(other.lines)
+    
+    def getvalue(self) -> str:
+        return '\n'.join(self.lines) + '\n' if self.lines else ''
+    
+    def flush(self) -> None:
+        if self.lines:
+            sys.stdout.write(self.getvalue())
+            sys.stdout.flush()
+            self.lines = []
+
+
+class _SanitizeTable(dict):
+    """
+    str.translate table for folder names, filled in lazily per character
+    
+    Whitespace maps to an underscore, ASCII letters, digits and underscores
+    are kept, and every other character is dropped.
+    """
+    
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        if char in _ALLOWED_CHARS:
+            value = char
+        elif char.isspace():
+            value = '_'
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_folder_name(name: str) -> Optional[str]:
     """
     Sanitize folder names for file system compatibility
@@ -44,17 +142,15 @@ def sanitize_folder_name(name: str) -> Optional[str]:
     Returns:
         Sanitized folder name or None if name cannot be sanitized
     """
-    # Replace spaces with underscores
-    sanitized = re.sub(r'\s+', '_', name)
-    
-    # Remove all non-alphanumeric characters except underscores
-    sanitized = re.sub(r'[^a-zA-Z0-9_]', '', sanitized)
+    # Already-clean names (e.g. on re-runs) come back unchanged
+    if _CLEAN_NAME.fullmatch(name):
+        return name
     
-    # Remove leading/trailing underscores
-    sanitized = sanitized.strip('_')
+    # Whitespace becomes underscores, other disallowed characters are removed
+    sanitized = name.translate(_SANITIZE_TABLE)
     
-    # Replace multiple consecutive underscores with single underscore
-    sanitized = re.sub(r'_{2,}', '_', sanitized)
+    # Collapse underscore runs and remove leading/trailing underscores
+    sanitized = _MULTI_UNDERSCORE.sub('_', sanitized).strip('_')
     
     # Handle empty names
     if not sanitized:
@@ -63,187 +159,340 @@ def sanitize_folder_name(name: str) -> Optional[str]:
     return sanitized
 
 
-def rename_visual_folders(page_path: Path) -> int:
+def build_folder_name(prefix: str, name: str) -> Optional[str]:
+    """
+    Build a sanitized "prefix_name" folder name
+    
+    Each part is sanitized separately so the few distinct prefixes (visual
+    types, page display names) are served from the sanitize cache instead of
+    being re-processed with every unique name.
+    
+    Args:
+        prefix: The visualType or displayName
+        name: The visual or page name
+        
+    Returns:
+        Sanitized folder name or None if name cannot be sanitized
+    """
+    parts = [part for part in (sanitize_folder_name(str(prefix)), sanitize_folder_name(str(name))) if part]
+    return '_'.join(parts) or None
+
+
+def _read_json_fields(json_path: str, fields: Tuple[str, ...]) -> Dict[str, object]:
+    """
+    Read selected scalar fields from a JSON file
+    
+    Fields are dotted key paths such as 'visual.visualType'. When ijson is
+    installed the file is streamed and parsing stops as soon as every field
+    has been seen, so large formatting trees are never materialized. Otherwise
+    the file is parsed in full (with orjson when installed).
+    
+    Args:
+        json_path: Path to the JSON file
+        fields: Dotted key paths to extract
+        
+    Returns:
+        Dict of field path to value (None for fields that are missing)
+    """
+    values = dict.fromkeys(fields)
+    
+    if ijson is not None:
+        remaining = set(fields)
+        with open(json_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix in remaining and event in ('string', 'number', 'boolean', 'null'):
+                    values[prefix] = value
+                    remaining.discard(prefix)
+                    if not remaining:
+                        break
+        return values
+    
+    # Parse the raw bytes directly, skipping the text decoding layer
+    with open(json_path, 'rb') as f:
+        data = _json_loads(f.read())
+    
+    for field in fields:
+        value = data
+        for key in field.split('.'):
+            value = value.get(key) if isinstance(value, dict) else None
+        values[field] = value
+    
+    return values
+
+
+def _rename_lock(parent_dir: str) -> threading.Lock:
+    """
+    Get the lock that serializes renames inside a directory
+    
+    Args:
+        parent_dir: Directory whose children are being renamed
+        
+    Returns:
+        Lock shared by all workers renaming within parent_dir
+    """
+    with _rename_locks_guard:
+        return _rename_locks[parent_dir]
+
+
+def _rename_folder(src: str, dst: str, parent_dir: str) -> bool:
+    """
+    Rename a folder unless the target name is already taken
+    
+    Args:
+        src: Current folder path
+        dst: New folder path
+        parent_dir: Directory containing both paths
+        
+    Returns:
+        True if renamed, False if the target folder already exists
+    """
+    # Check-and-rename must be atomic with respect to sibling folders
+    with _rename_lock(parent_dir):
+        if os.path.lexists(dst):
+            return False
+        
+        # The check above is still racy against other processes, so a
+        # target created in the meantime is detected from the rename itself
+        try:
+            os.rename(src, dst)
+        except OSError as e:
+            if e.errno in (errno.EEXIST, errno.ENOTEMPTY):
+                return False
+            raise
+    
+    return True
+
+
+def _process_visual_folder(visual_folder: os.DirEntry, visuals_dir: str) -> Tuple[bool, _LogBuffer]:
+    """
+    Rename a single visual folder based on visualType and name from visual.json
+    
+    Args:
+        visual_folder: Directory entry for the visual folder
+        visuals_dir: Path to the parent visuals directory
+        
+    Returns:
+        Tuple of (processed, log buffer)
+    """
+    buf = _LogBuffer()
+    visual_json_path = os.path.join(visual_folder.path, "visual.json")
+    
+    try:
+        # Extract visualType and name from visual.json
+        try:
+            visual_json = _read_json_fields(visual_json_path, ('visual.visualType', 'name'))
+        except FileNotFoundError:
+            buf.log(f"    ⚠ Skipping visual folder '{visual_folder.name}' - no visual.json found")
+            return False, buf
+        
+        visual_type = visual_json['visual.visualType']
+        visual_name = visual_json['name']
+        
+        # A report reuses a handful of visual types, so share one string object per type
+        if isinstance(visual_type, str):
+            visual_type = sys.intern(visual_type)
+        
+        if not visual_type or not visual_name:
+            buf.log(f"    ⚠ Skipping visual folder '{visual_folder.name}' - missing visualType or name")
+            return False, buf
+        
+        # Create sanitized folder name: visualType_name
+        sanitized_visual_name = build_folder_name(visual_type, visual_name)
+        
+        if not sanitized_visual_name:
+            buf.log(f"    ⚠ Skipping visual folder '{visual_folder.name}' - name cannot be sanitized")
+            return False, buf
+        
+        # Check if folder name already matches
+        if visual_folder.name == sanitized_visual_name:
+            buf.log(f"    ✓ Visual already correct: {visual_folder.name} {_C['d']}(grey){_C['e']}")  # Grey color
+            return True, buf
+        
+        # Construct new folder path
+        new_visual_folder_path = os.path.join(visuals_dir, sanitized_visual_name)
+        
+        # Rename the visual folder unless the target folder already exists
+        if not _rename_folder(visual_folder.path, new_visual_folder_path, visuals_dir):
+            buf.log(f"    ⚠ Cannot rename visual '{visual_folder.name}' to '{sanitized_visual_name}' - target folder already exists")
+            return False, buf
+        buf.log(f"    {_C['g']}✓ Visual renamed: {visual_folder.name} → {sanitized_visual_name}{_C['e']}")  # Green
+        return True, buf
+        
+    except Exception as e:
+        buf.log(f"    ✗ Failed to process visual folder '{visual_folder.name}': {e}")
+        return False, buf
+
+
+def rename_visual_folders(page_path: str, buf: Optional[_LogBuffer] = None,
+                          executor: Optional[Executor] = None) -> int:
     """
     Rename visual folders based on visualType and name from visual.json
     
     Args:
         page_path: Path to the page folder
+        buf: Buffer to log to (output is written to stdout if not given)
+        executor: Executor to process visuals on (a private pool is used if not given)
         
     Returns:
         Number of visual folders successfully processed
     """
-    visuals_dir = page_path / "visuals"
-    
-    # Check if visuals directory exists
-    if not visuals_dir.exists():
-        return 0
+    if buf is None:
+        buf = _LogBuffer()
+        try:
+            return rename_visual_folders(page_path, buf, executor)
+        finally:
+            buf.flush()
     
-    # Get all visual folders
-    visual_folders = [d for d in visuals_dir.iterdir() if d.is_dir()]
+    visuals_dir = os.path.join(page_path, "visuals")
     
-    if not visual_folders:
+    # Get all visual folders (a missing visuals directory just means no visuals).
+    # The listing must be complete before workers start renaming entries in it.
+    try:
+        with os.scandir(visuals_dir) as entries:
+            visual_folders = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except (FileNotFoundError, NotADirectoryError):
         return 0
     
+    process = functools.partial(_process_visual_folder, visuals_dir=visuals_dir)
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS) if executor is None else contextlib.nullcontext(executor)
     visual_success_count = 0
     
-    for visual_folder in visual_folders:
-        visual_json_path = visual_folder / "visual.json"
-        
-        # Check if visual.json exists
-        if not visual_json_path.exists():
-            print(f"    ⚠ Skipping visual folder '{visual_folder.name}' - no visual.json found")
-            continue
+    with pool as visual_executor:
+        for processed, visual_buf in visual_executor.map(process, visual_folders):
+            visual_success_count += processed
+            buf.extend(visual_buf)
+    
+    return visual_success_count
+
+
+def _process_page_folder(folder: os.DirEntry, pages_dir: str, visual_executor: Executor) -> Tuple[int, int, _LogBuffer]:
+    """
+    Rename a single page folder and then its visual folders
+    
+    Args:
+        folder: Directory entry for the page folder
+        pages_dir: Path to the parent pages directory
+        visual_executor: Executor the page's visuals are processed on
         
+    Returns:
+        Tuple of (pages_processed, visuals_processed, log buffer)
+    """
+    buf = _LogBuffer()
+    page_json_path = os.path.join(folder.path, "page.json")
+    
+    try:
+        # Extract display name and name from page.json (like visuals: displayName_name)
         try:
-            # Read and parse visual.json
-            with open(visual_json_path, 'r', encoding='utf-8') as f:
-                visual_json = json.load(f)
-            
-            # Extract visualType and name
-            visual_type = visual_json.get('visual', {}).get('visualType')
-            visual_name = visual_json.get('name')
-            
-            if not visual_type or not visual_name:
-                print(f"    ⚠ Skipping visual folder '{visual_folder.name}' - missing visualType or name")
-                continue
-            
-            # Create new folder name: visualType_name
-            new_visual_folder_name = f"{visual_type}_{visual_name}"
-            
-            # Sanitize the folder name
-            sanitized_visual_name = sanitize_folder_name(new_visual_folder_name)
-            
-            if not sanitized_visual_name:
-                print(f"    ⚠ Skipping visual folder '{visual_folder.name}' - name cannot be sanitized")
-                continue
-            
-            # Check if folder name already matches
-            if visual_folder.name == sanitized_visual_name:
-                print(f"    ✓ Visual already correct: {visual_folder.name}", end='')
-                print(f" \033[90m(grey)\033[0m")  # Grey color
-                visual_success_count += 1
-                continue
-            
-            # Construct new folder path
-            new_visual_folder_path = visuals_dir / sanitized_visual_name
-            
-            # Check if target folder already exists
-            if new_visual_folder_path.exists():
-                print(f"    ⚠ Cannot rename visual '{visual_folder.name}' to '{sanitized_visual_name}' - target folder already exists")
-                continue
-            
-            # Rename the visual folder
-            visual_folder.rename(new_visual_folder_path)
-            print(f"    \033[92m✓ Visual renamed: {visual_folder.name} → {sanitized_visual_name}\033[0m")  # Green
-            visual_success_count += 1
+            page_json = _read_json_fields(page_json_path, ('displayName', 'name'))
+        except FileNotFoundError:
+            buf.log(f"⚠ Skipping folder '{folder.name}' - no page.json found")
+            return 0, 0, buf
+        
+        display_name = page_json['displayName']
+        page_name = page_json['name']
+        
+        # Display names repeat across pages and reports; page names are unique
+        if isinstance(display_name, str):
+            display_name = sys.intern(display_name)
+        
+        if not display_name or not page_name:
+            buf.log(f"⚠ Skipping folder '{folder.name}' - missing displayName or name")
+            return 0, 0, buf
+        
+        # Create sanitized folder name: displayName_name (like visuals)
+        sanitized_name = build_folder_name(display_name, page_name)
+        
+        if not sanitized_name:
+            buf.log(f"⚠ Skipping folder '{folder.name}' - name cannot be sanitized")
+            return 0, 0, buf
+        
+        # Check if folder name already matches
+        if folder.name == sanitized_name:
+            buf.log(f"{_C['d']}✓ Page already correct: {folder.name}{_C['e']}")  # Grey
             
-        except Exception as e:
-            print(f"    ✗ Failed to process visual folder '{visual_folder.name}': {e}")
-    
-    return visual_success_count
+            # Process visual folders within this page
+            page_visual_count = rename_visual_folders(folder.path, buf, visual_executor)
+            return 1, page_visual_count, buf
+        
+        # Construct new folder path
+        new_folder_path = os.path.join(pages_dir, sanitized_name)
+        
+        # Rename the folder unless the target folder already exists
+        if not _rename_folder(folder.path, new_folder_path, pages_dir):
+            buf.log(f"⚠ Cannot rename '{folder.name}' to '{sanitized_name}' - target folder already exists")
+            return 0, 0, buf
+        buf.log(f"{_C['g']}✓ Page renamed: {folder.name} → {sanitized_name}{_C['e']}")  # Green
+        
+        # Process visual folders within the renamed page
+        page_visual_count = rename_visual_folders(new_folder_path, buf, visual_executor)
+        return 1, page_visual_count, buf
+        
+    except Exception as e:
+        buf.log(f"✗ Failed to process folder '{folder.name}': {e}")
+        return 0, 0, buf
 
 
-def rename_page_folders(report_path: Path) -> Tuple[bool, int, int]:
+def rename_page_folders(report_path: Path, buf: Optional[_LogBuffer] = None) -> Tuple[bool, int, int]:
     """
     Rename page folders based on displayName and name from page.json
     
+    Pages are processed concurrently; each page's output is buffered and
+    merged in folder order, then written in one go once the report is done.
+    
     Args:
         report_path: Path to the .Report folder
+        buf: Buffer to log to (output is written to stdout if not given)
         
     Returns:
         Tuple of (success, pages_processed, visuals_processed)
     """
+    if buf is None:
+        buf = _LogBuffer()
+        try:
+            return rename_page_folders(report_path, buf)
+        finally:
+            buf.flush()
+    
     # Construct pages directory path
     pages_dir = report_path / "definition" / "pages"
+    pages_dir_str = str(pages_dir)
     
-    # Verify pages directory exists
-    if not pages_dir.exists():
-        print(f"✗ Pages directory not found: {pages_dir}")
+    # Get all subdirectories (excluding pages.json). The listing must be
+    # complete before workers start renaming entries in it.
+    try:
+        with os.scandir(pages_dir_str) as entries:
+            page_folders = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except (FileNotFoundError, NotADirectoryError):
+        buf.log(f"✗ Pages directory not found: {pages_dir}")
         return False, 0, 0
     
-    print(f"\033[92mProcessing pages directory: {pages_dir}\033[0m")  # Green
-    print()
-    
-    # Get all subdirectories (excluding pages.json)
-    page_folders = [d for d in pages_dir.iterdir() if d.is_dir()]
-    
-    if not page_folders:
-        print(f"⚠ No page folders found in {pages_dir}")
-        return False, 0, 0
+    buf.log(f"{_C['g']}Processing pages directory: {pages_dir}{_C['e']}")  # Green
+    buf.log()
     
     success_count = 0
     visual_success_count = 0
-    total_count = len(page_folders)
-    
-    for folder in page_folders:
-        page_json_path = folder / "page.json"
-        
-        # Check if page.json exists
-        if not page_json_path.exists():
-            print(f"⚠ Skipping folder '{folder.name}' - no page.json found")
-            continue
-        
-        try:
-            # Read and parse page.json
-            with open(page_json_path, 'r', encoding='utf-8') as f:
-                page_json = json.load(f)
-            
-            # Extract display name and name (like visuals: displayName_name)
-            display_name = page_json.get('displayName')
-            page_name = page_json.get('name')
-            
-            if not display_name or not page_name:
-                print(f"⚠ Skipping folder '{folder.name}' - missing displayName or name")
-                continue
-            
-            # Create new folder name: displayName_name (like visuals)
-            new_page_folder_name = f"{display_name}_{page_name}"
-            
-            # Sanitize the folder name
-            sanitized_name = sanitize_folder_name(new_page_folder_name)
-            
-            if not sanitized_name:
-                print(f"⚠ Skipping folder '{folder.name}' - name cannot be sanitized")
-                continue
-            
-            # Check if folder name already matches
-            if folder.name == sanitized_name:
-                print(f"\033[90m✓ Page already correct: {folder.name}\033[0m")  # Grey
-                success_count += 1
-                
-                # Process visual folders within this page
-                page_visual_count = rename_visual_folders(folder)
-                visual_success_count += page_visual_count
-                continue
-            
-            # Construct new folder path
-            new_folder_path = pages_dir / sanitized_name
-            
-            # Check if target folder already exists
-            if new_folder_path.exists():
-                print(f"⚠ Cannot rename '{folder.name}' to '{sanitized_name}' - target folder already exists")
-                continue
-            
-            # Rename the folder
-            folder.rename(new_folder_path)
-            print(f"\033[92m✓ Page renamed: {folder.name} → {sanitized_name}\033[0m")  # Green
-            success_count += 1
-            
-            # Process visual folders within the renamed page
-            renamed_page_path = pages_dir / sanitized_name
-            page_visual_count = rename_visual_folders(renamed_page_path)
+    total_count = 0
+    
+    # Visuals get their own pool so page tasks never wait on their own pool
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as page_executor, \
+            ThreadPoolExecutor(max_workers=MAX_WORKERS) as visual_executor:
+        process = functools.partial(_process_page_folder, pages_dir=pages_dir_str, visual_executor=visual_executor)
+        for pages_processed, page_visual_count, page_buf in page_executor.map(process, page_folders):
+            total_count += 1
+            success_count += pages_processed
             visual_success_count += page_visual_count
-            
-        except Exception as e:
-            print(f"✗ Failed to process folder '{folder.name}': {e}")
+            buf.extend(page_buf)
     
-    print()
-    print("\033[96mSummary:\033[0m")  # Cyan
-    print(f"  Total page folders: {total_count}")
-    print(f"  \033[92mPages successfully processed: {success_count}\033[0m")  # Green
-    print(f"  \033[93mPages failed/skipped: {total_count - success_count}\033[0m")  # Yellow
-    print(f"  \033[92mVisual folders processed: {visual_success_count}\033[0m")  # Green
+    if total_count == 0:
+        buf.log(f"⚠ No page folders found in {pages_dir}")
+        return False, 0, 0
+    
+    buf.log()
+    buf.log(f"{_C['c']}Summary:{_C['e']}")  # Cyan
+    buf.log(f"  Total page folders: {total_count}")
+    buf.log(f"  {_C['g']}Pages successfully processed: {success_count}{_C['e']}")  # Green
+    buf.log(f"  {_C['y']}Pages failed/skipped: {total_count - success_count}{_C['e']}")  # Yellow
+    buf.log(f"  {_C['g']}Visual folders processed: {visual_success_count}{_C['e']}")  # Green
     
     return (success_count > 0 or visual_success_count > 0), success_count, visual_success_count
 
@@ -255,80 +504,153 @@ def interactive_mode() -> Optional[Path]:
     Returns:
         Path to the .Report folder or None if user wants to exit
     """
-    print("\033[96m=== Power BI Page & Visual Folder Renamer ===\033[0m")
-    print("\033[93mThis script will rename page and visual folders to human-readable names:\033[0m")
-    print("\033[93m  • Pages: displayName_name (e.g., Sales_Overview_50dd411cef39de30a198)\033[0m")
-    print("\033[93m  • Visuals: visualType_name (e.g., clusteredBarChart_2402e6f6ec7ad97e9443)\033[0m")
+    print(f"{_C['c']}=== Power BI Page & Visual Folder Renamer ==={_C['e']}")
+    print(f"{_C['y']}This script will rename page and visual folders to human-readable names:{_C['e']}")
+    print(f"{_C['y']}  • Pages: displayName_name (e.g., Sales_Overview_50dd411cef39de30a198){_C['e']}")
+    print(f"{_C['y']}  • Visuals: visualType_name (e.g., clusteredBarChart_2402e6f6ec7ad97e9443){_C['e']}")
     print()
-    print("\033[90mExample: /home/user/MyProject/reports/MyReport.Report\033[0m")
+    print(f"{_C['d']}Example: /home/user/MyProject/reports/MyReport.Report{_C['e']}")
     print()
     
     while True:
         report_dir = input("Enter the full path to the .Report folder: ").strip()
         
         if not report_dir:
-            print("\033[91mPath cannot be empty. Please try again.\033[0m")
+            print(f"{_C['r']}Path cannot be empty. Please try again.{_C['e']}")
             continue
         
         # Check if path ends with .Report
         if not report_dir.lower().endswith(".report"):
-            print("\033[91mPath must end with '.Report'. Please try again.\033[0m")
+            print(f"{_C['r']}Path must end with '.Report'. Please try again.{_C['e']}")
             continue
         
         report_path = Path(report_dir)
         
         # Check if path exists
         if not report_path.exists():
-            print(f"\033[91mPath does not exist: {report_path}\033[0m")
-            print("\033[91mPlease check the path and try again.\033[0m")
+            print(f"{_C['r']}Path does not exist: {report_path}{_C['e']}")
+            print(f"{_C['r']}Please check the path and try again.{_C['e']}")
             continue
         
         # Check if it's a directory
         if not report_path.is_dir():
-            print(f"\033[91mPath is not a directory: {report_path}\033[0m")
+            print(f"{_C['r']}Path is not a directory: {report_path}{_C['e']}")
             continue
         
         return report_path
 
 
-def find_report_folders(search_root: Path, max_depth: int = 5) -> list:
+def _find_report_folders_fwalk(search_root: str, max_depth: int, skip_dirs: frozenset) -> list:
     """
-    Auto-detect .Report folders relative to search root
+    Find .Report folders with os.fwalk (POSIX)
+    
+    Checks are made relative to each directory's file descriptor, so the
+    kernel never has to resolve the full path for every entry.
+    
+    Args:
+        search_root: Directory to start searching from
+        max_depth: Maximum directory depth to search
+        skip_dirs: Directory names never descended into
+        
+    Returns:
+        List of Path objects to .Report folders found
+    """
+    report_folders = []
+    root_depth = search_root.rstrip(os.sep).count(os.sep)
+    
+    for root, dirs, _, rootfd in os.fwalk(search_root, follow_symlinks=False):
+        depth = root.count(os.sep) - root_depth
+        subdirs = []
+        for name in dirs:
+            if name.lower().endswith('.report'):
+                # Verify it's a valid PBIR report (has definition/pages)
+                try:
+                    pages_stat = os.stat(os.path.join(name, "definition", "pages"), dir_fd=rootfd)
+                except OSError:
+                    continue
+                if stat.S_ISDIR(pages_stat.st_mode):
+                    report_folders.append(Path(root, name))
+            elif depth < max_depth and not name.startswith('.') and name not in skip_dirs:
+                subdirs.append(name)
+        # Prune in place so fwalk only descends into the remaining directories
+        dirs[:] = subdirs
+    
+    return report_folders
+
+
+def _find_report_folders_scandir(search_root: str, max_depth: int, skip_dirs: frozenset) -> list:
+    """
+    Find .Report folders with os.scandir (used where os.fwalk is unavailable)
     
     Args:
         search_root: Directory to start searching from
         max_depth: Maximum directory depth to search
+        skip_dirs: Directory names never descended into
         
     Returns:
         List of Path objects to .Report folders found
     """
     report_folders = []
+    # Explicit stack instead of recursion; results are sorted, so visit order doesn't matter
+    stack = [(search_root, 0)]
     
-    def search_dir(path: Path, depth: int):
-        if depth > max_depth:
-            return
+    while stack:
+        path, depth = stack.pop()
         try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    if item.name.lower().endswith('.report'):
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # Filter on the name first so skipped entries are never stat'ed
+                    name = entry.name
+                    is_report = name.lower().endswith('.report')
+                    if not is_report and (depth >= max_depth or name.startswith('.') or name in skip_dirs):
+                        continue
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if is_report:
                         # Verify it's a valid PBIR report (has definition/pages)
-                        if (item / "definition" / "pages").exists():
-                            report_folders.append(item)
+                        if os.path.isdir(os.path.join(entry.path, "definition", "pages")):
+                            report_folders.append(Path(entry.path))
                     else:
-                        search_dir(item, depth + 1)
+                        stack.append((entry.path, depth + 1))
         except PermissionError:
             pass
     
-    search_dir(search_root, 0)
+    return report_folders
+
+
+def find_report_folders(search_root: Path, max_depth: int = 5, exclude: Iterable[str] = ()) -> list:
+    """
+    Auto-detect .Report folders relative to search root
+    
+    Hidden directories and common dependency/build/cache folders are never
+    descended into.
+    
+    Args:
+        search_root: Directory to start searching from
+        max_depth: Maximum directory depth to search
+        exclude: Additional directory names to skip
+        
+    Returns:
+        List of Path objects to .Report folders found
+    """
+    skip_dirs = _SKIP_DIRS.union(exclude)
+    
+    # os.fwalk is POSIX-only (not available on Windows)
+    if hasattr(os, 'fwalk'):
+        report_folders = _find_report_folders_fwalk(str(search_root), max_depth, skip_dirs)
+    else:
+        report_folders = _find_report_folders_scandir(str(search_root), max_depth, skip_dirs)
+    
     return sorted(report_folders, key=lambda p: str(p).lower())
 
 
-def auto_detect_mode(script_location: Path) -> Optional[Path]:
+def auto_detect_mode(script_location: Path, exclude: Iterable[str] = ()) -> Optional[Path]:
     """
     Auto-detect .Report folders relative to where the script is located
     
     Args:
         script_location: Path to this script file
+        exclude: Additional directory names to skip while searching
         
     Returns:
         Path to selected .Report folder, list of paths, or None
@@ -340,24 +662,24 @@ def auto_detect_mode(script_location: Path) -> Optional[Path]:
     if search_root.name.lower() in ('scripts', 'tools', 'utils', 'bin'):
         search_root = search_root.parent
     
-    print("\033[96m=== Power BI Page & Visual Folder Renamer ===\033[0m")
-    print(f"\033[90mSearching for .Report folders in: {search_root}\033[0m")
+    print(f"{_C['c']}=== Power BI Page & Visual Folder Renamer ==={_C['e']}")
+    print(f"{_C['d']}Searching for .Report folders in: {search_root}{_C['e']}")
     print()
     
-    report_folders = find_report_folders(search_root)
+    report_folders = find_report_folders(search_root, exclude=exclude)
     
     if not report_folders:
-        print("\033[93m⚠ No .Report folders found in this repository.\033[0m")
-        print("\033[90mTip: Place this script in a repo containing Power BI .Report folders.\033[0m")
+        print(f"{_C['y']}⚠ No .Report folders found in this repository.{_C['e']}")
+        print(f"{_C['d']}Tip: Place this script in a repo containing Power BI .Report folders.{_C['e']}")
         return None
     
     if len(report_folders) == 1:
         # Single report found - use it automatically
-        print(f"\033[92m✓ Found 1 report: {report_folders[0].name}\033[0m")
+        print(f"{_C['g']}✓ Found 1 report: {report_folders[0].name}{_C['e']}")
         return report_folders[0]
     
     # Multiple reports found - let user choose
-    print(f"\033[92m✓ Found {len(report_folders)} reports:\033[0m")
+    print(f"{_C['g']}✓ Found {len(report_folders)} reports:{_C['e']}")
     print()
     for i, folder in enumerate(report_folders, 1):
         # Show relative path from search root
@@ -381,9 +703,43 @@ def auto_detect_mode(script_location: Path) -> Optional[Path]:
                 return report_folders  # Return list for batch processing
             if 1 <= choice_num <= len(report_folders):
                 return report_folders[choice_num - 1]
-            print("\033[91mInvalid selection. Please try again.\033[0m")
+            print(f"{_C['r']}Invalid selection. Please try again.{_C['e']}")
         except ValueError:
-            print("\033[91mPlease enter a number.\033[0m")
+            print(f"{_C['r']}Please enter a number.{_C['e']}")
+
+
+def process_report(report_directory: Path) -> Tuple[int, int, str]:
+    """
+    Validate a report directory and rename its page and visual folders
+    
+    Output is returned rather than printed so reports can be processed in
+    worker processes and still be written out one report at a time.
+    
+    Args:
+        report_directory: Path to the .Report folder
+        
+    Returns:
+        Tuple of (pages_processed, visuals_processed, output)
+    """
+    buf = _LogBuffer()
+    
+    # Validate the provided path
+    if not report_directory.exists():
+        buf.log(f"✗ Report directory does not exist: {report_directory}")
+        return 0, 0, buf.getvalue()
+    
+    if not str(report_directory).lower().endswith(".report"):
+        buf.log("✗ Report directory must end with '.Report'")
+        return 0, 0, buf.getvalue()
+    
+    # Execute the renaming
+    buf.log()
+    buf.log(f"{_C['c']}Starting page folder renaming process...{_C['e']}")
+    buf.log(f"Report: {report_directory}")
+    buf.log()
+    
+    _, pages_processed, visuals_processed = rename_page_folders(report_directory, buf)
+    return pages_processed, visuals_processed, buf.getvalue()
 
 
 def main():
@@ -395,6 +751,7 @@ def main():
 Examples:
   %(prog)s                                    # Auto-detect reports in repo
   %(prog)s /path/to/MyReport.Report          # Process specific report
+  %(prog)s --exclude archive                  # Auto-detect, skipping 'archive' folders
   %(prog)s "C:\\MyProject\\reports\\MyReport.Report"
         """
     )
@@ -405,6 +762,14 @@ Examples:
         help='Path to the .Report folder (auto-detects if not specified)'
     )
     
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        metavar='DIR',
+        help='Directory name to skip when auto-detecting reports (repeatable)'
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -414,7 +779,7 @@ Examples:
         else:
             # Auto-detect mode - find reports relative to script location
             script_path = Path(__file__).resolve()
-            result = auto_detect_mode(script_path)
+            result = auto_detect_mode(script_path, args.exclude)
             if not result:
                 return 1
             # Handle single or multiple reports
@@ -423,43 +788,40 @@ Examples:
         total_pages = 0
         total_visuals = 0
         
-        for report_directory in report_directories:
-            # Validate the provided path
-            if not report_directory.exists():
-                print(f"✗ Report directory does not exist: {report_directory}")
-                continue
-            
-            if not str(report_directory).lower().endswith(".report"):
-                print("✗ Report directory must end with '.Report'")
-                continue
-            
-            # Execute the renaming
-            print()
-            print("\033[96mStarting page folder renaming process...\033[0m")
-            print(f"Report: {report_directory}")
-            print()
-            
-            success, pages_processed, visuals_processed = rename_page_folders(report_directory)
+        if len(report_directories) > 1:
+            # Reports are independent, so process them in parallel and print each as it finishes
+            max_workers = min(len(report_directories), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(process_report, d) for d in report_directories]
+                for future in as_completed(futures):
+                    pages_processed, visuals_processed, output = future.result()
+                    sys.stdout.write(output)
+                    sys.stdout.flush()
+                    total_pages += pages_processed
+                    total_visuals += visuals_processed
+        else:
+            pages_processed, visuals_processed, output = process_report(report_directories[0])
+            sys.stdout.write(output)
             total_pages += pages_processed
             total_visuals += visuals_processed
         
         if len(report_directories) > 1:
             print()
-            print("\033[96m=== Overall Summary ===\033[0m")
+            print(f"{_C['c']}=== Overall Summary ==={_C['e']}")
             print(f"  Reports processed: {len(report_directories)}")
             print(f"  Total pages: {total_pages}")
             print(f"  Total visuals: {total_visuals}")
         
         print()
-        print("\033[92mProcessing complete!\033[0m")
+        print(f"{_C['g']}Processing complete!{_C['e']}")
         return 0
             
     except KeyboardInterrupt:
         print()
-        print("\033[93mOperation cancelled by user.\033[0m")
+        print(f"{_C['y']}Operation cancelled by user.{_C['e']}")
         return 130
     except Exception as e:
-        print(f"\033[91m✗ An error occurred: {e}\033[0m")
+        print(f"{_C['r']}✗ An error occurred: {e}{_C['e']}")
         return 1
 
 
@@ -18,14 +18,509 @@ How to run:
 
 Requirements: Python 3.7+ (no external dependencies)
 """
+import os
 import re
+import gzip
 import json
+import base64
+import html
 import sys
 import argparse
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import webbrowser
 
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# TMDL patterns, compiled once rather than per file / per relationship block
+_REL_SPLIT_RE = re.compile(r'(?:^|\n)relationship\s+[\w-]+\n', re.MULTILINE)
+_REL_ID_RE = re.compile(r'(?:^|\n)relationship\s+([\w-]+)\n', re.MULTILINE)
+# One pass over a block picks up every property line we care about
+_KV_RE = re.compile(
+    r'^[ \t]*(fromColumn|toColumn|fromCardinality|toCardinality|crossFilteringBehavior|isActive)'
+    r':[ \t]*(.+?)\s*$',
+    re.MULTILINE
+)
+# 'Table'.'Column' -> (Table, Column): split on the first dot, surrounding quotes dropped
+_TABLE_COL_RE = re.compile(r"""^['"]*([^.]*?)['"]*(?:\.['"]*(.*?)['"]*)?$""")
+# Table-name prefix used to group oversized models ('Dim_Date' -> 'Dim', 'Fact Sales' -> 'Fact')
+_GROUP_PREFIX_RE = re.compile(r'[_\s]')
+AGGREGATE_THRESHOLD = 500
+# Graph renderers. 'visjs' is the default canvas renderer; 'sigma' swaps in sigma.js
+# (WebGL) behind a small vis.js-compatible facade so the viewer logic is shared.
+_RENDERER_SCRIPTS = {
+    'visjs': '<script type="text/javascript" defer src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>',
+    'sigma': '\n    '.join([
+        '<script type="text/javascript" defer src="https://unpkg.com/graphology@0.25.4/dist/graphology.umd.min.js"></script>',
+        '<script type="text/javascript" defer src="https://unpkg.com/graphology-library@0.8.0/dist/graphology-library.min.js"></script>',
+        '<script type="text/javascript" defer src="https://unpkg.com/sigma@2.4.0/build/sigma.min.js"></script>',
+    ]),
+}
+
+_SIGMA_FACADE_JS = """
+    <script type="text/javascript">
+        // Implements the slice of the vis.js API the viewer uses (DataSet + Network)
+        // on top of a graphology graph rendered by sigma.js.
+        class GraphStore {
+            constructor(items) {
+                this._items = new Map();
+                this._net = null;
+                if (items) this.add(items);
+            }
+            add(items) {
+                [].concat(items).forEach(item => {
+                    this._items.set(item.id, Object.assign({}, item));
+                    if (this._net) this._net._put(this, item.id);
+                });
+            }
+            update(items) {
+                [].concat(items).forEach(item => {
+                    this._items.set(item.id, Object.assign(this._items.get(item.id) || {}, item));
+                    if (this._net) this._net._put(this, item.id);
+                });
+            }
+            remove(ids) {
+                [].concat(ids).forEach(id => {
+                    if (this._net) this._net._drop(this, id);
+                    this._items.delete(id);
+                });
+            }
+            clear() {
+                if (this._net) this._net._clear(this);
+                this._items.clear();
+            }
+            get(id) {
+                return id === undefined ? Array.from(this._items.values()) : (this._items.get(id) || null);
+            }
+            getIds() {
+                return Array.from(this._items.keys());
+            }
+            get length() {
+                return this._items.size;
+            }
+        }
+        
+        class SigmaNetwork {
+            constructor(container, data, options) {
+                this.nodes = data.nodes;
+                this.edges = data.edges;
+                this.handlers = {};
+                this.lastPositions = new Map();
+                this.graph = new graphology.MultiDirectedGraph();
+                this.nodes._net = this;
+                this.edges._net = this;
+                this.nodes.getIds().forEach(id => this._put(this.nodes, id));
+                this.edges.getIds().forEach(id => this._put(this.edges, id));
+                
+                // ForceAtlas2 runs up front in place of vis.js physics
+                const physics = options.physics || {};
+                if (physics.enabled !== false && this.graph.order > 0) {
+                    graphologyLibrary.layout.circular.assign(this.graph);
+                    graphologyLibrary.layoutForceAtlas2.assign(this.graph, {
+                        iterations: (physics.stabilization && physics.stabilization.iterations) || 100,
+                        settings: graphologyLibrary.layoutForceAtlas2.inferSettings(this.graph)
+                    });
+                }
+                
+                this.renderer = new Sigma(this.graph, container, { defaultEdgeType: 'arrow' });
+                this.renderer.on('clickNode', e => this._emit('click', { nodes: [e.node], edges: [] }));
+                this.renderer.on('clickStage', () => this._emit('click', { nodes: [], edges: [] }));
+                setTimeout(() => {
+                    this._emit('stabilizationIterationsDone', {});
+                    this._emit('afterDrawing', {});
+                }, 0);
+            }
+            _put(store, id) {
+                const item = store._items.get(id);
+                if (store === this.nodes) {
+                    const prev = this.graph.hasNode(id) ? this.graph.getNodeAttributes(id) : this.lastPositions.get(id);
+                    this.graph.mergeNode(id, {
+                        label: item.label,
+                        x: item.x !== undefined ? item.x : (prev ? prev.x : Math.random()),
+                        y: item.y !== undefined ? item.y : (prev ? prev.y : Math.random()),
+                        size: item.is_fact ? 10 : 7,
+                        color: typeof item.color === 'string' ? item.color : item.color.background
+                    });
+                } else {
+                    const key = String(id);
+                    const attrs = {
+                        size: item.width || 1,
+                        color: item.color,
+                        type: String(item.arrows || '').indexOf('to') >= 0 ? 'arrow' : 'line'
+                    };
+                    if (this.graph.hasEdge(key)) {
+                        this.graph.mergeEdgeAttributes(key, attrs);
+                    } else {
+                        this.graph.addEdgeWithKey(key, item.from, item.to, attrs);
+                    }
+                }
+            }
+            _drop(store, id) {
+                if (store === this.nodes) {
+                    if (!this.graph.hasNode(id)) return;
+                    const attrs = this.graph.getNodeAttributes(id);
+                    this.lastPositions.set(id, { x: attrs.x, y: attrs.y });
+                    this.graph.dropNode(id);
+                } else if (this.graph.hasEdge(String(id))) {
+                    this.graph.dropEdge(String(id));
+                }
+            }
+            _clear(store) {
+                if (store === this.nodes) {
+                    // Remember where nodes were so re-shown tables keep their place
+                    this.graph.forEachNode((id, attrs) => this.lastPositions.set(id, { x: attrs.x, y: attrs.y }));
+                    this.graph.clear();
+                } else {
+                    this.graph.clearEdges();
+                }
+            }
+            _emit(event, params) {
+                (this.handlers[event] || []).slice().forEach(fn => fn.call(this, params));
+            }
+            on(event, fn) {
+                (this.handlers[event] = this.handlers[event] || []).push(fn);
+            }
+            once(event, fn) {
+                const wrapper = params => {
+                    this.handlers[event] = this.handlers[event].filter(f => f !== wrapper);
+                    fn.call(this, params);
+                };
+                this.on(event, wrapper);
+            }
+            getPositions() {
+                const positions = {};
+                this.graph.forEachNode((id, attrs) => {
+                    positions[id] = { x: attrs.x, y: attrs.y };
+                });
+                return positions;
+            }
+            setOptions() {}
+            stabilize() {
+                setTimeout(() => this._emit('stabilizationIterationsDone', {}), 0);
+            }
+            fit() {
+                this.renderer.getCamera().animatedReset({ duration: 500 });
+            }
+            destroy() {
+                this.renderer.kill();
+                this.nodes._net = null;
+                this.edges._net = null;
+            }
+        }
+        
+        const vis = { DataSet: GraphStore, Network: SigmaNetwork };
+    </script>"""
+
+# Viewer stylesheet (minified into the page by _minify_css)
+_CSS = """
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    margin: 0;
+    padding: 0;
+    background-color: #f5f5f5;
+}
+#header {
+    background-color: #2C3E50;
+    color: white;
+    padding: 15px 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+#header h1 {
+    margin: 0;
+    font-size: 24px;
+}
+#model-selector {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+#model-selector label {
+    font-size: 14px;
+    font-weight: bold;
+}
+#model-selector select {
+    padding: 8px 12px;
+    font-size: 14px;
+    border: none;
+    border-radius: 4px;
+    background-color: white;
+    color: #2C3E50;
+    cursor: pointer;
+    min-width: 300px;
+}
+#table-filter {
+    position: fixed;
+    left: 20px;
+    top: 140px;
+    width: 280px;
+    background: white;
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    padding: 15px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    max-height: calc(100vh - 160px);
+    overflow-y: auto;
+    display: none;
+    z-index: 2000;
+}
+#table-filter h3 {
+    margin-top: 0;
+    color: #2C3E50;
+    border-bottom: 2px solid #3498DB;
+    padding-bottom: 10px;
+    font-size: 16px;
+}
+#table-filter .close-btn {
+    float: right;
+    cursor: pointer;
+    color: #999;
+    font-size: 20px;
+    font-weight: bold;
+    line-height: 20px;
+}
+#table-filter .close-btn:hover {
+    color: #333;
+}
+#table-filter .filter-controls {
+    margin-bottom: 10px;
+    display: flex;
+    gap: 8px;
+}
+#table-filter .filter-controls button {
+    padding: 6px 12px;
+    font-size: 12px;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    background-color: #f8f9fa;
+    cursor: pointer;
+    flex: 1;
+}
+#table-filter .filter-controls button:hover {
+    background-color: #e9ecef;
+}
+#table-filter .table-list {
+    max-height: calc(100vh - 260px);
+    overflow-y: auto;
+}
+#table-filter .table-item {
+    display: flex;
+    align-items: center;
+    padding: 6px;
+    margin: 4px 0;
+    cursor: pointer;
+    border-radius: 4px;
+    font-size: 13px;
+}
+#table-filter .table-item:hover {
+    background-color: #f8f9fa;
+}
+#table-filter .table-item input[type="checkbox"] {
+    margin-right: 8px;
+    cursor: pointer;
+}
+#table-filter .table-item label {
+    cursor: pointer;
+}
+#table-filter .table-item.fact {
+    color: #C44545;
+    font-weight: 500;
+}
+#table-filter .table-item.dim {
+    color: #3BA39F;
+}
+#toggle-filter-btn {
+    position: fixed;
+    left: 20px;
+    top: 140px;
+    padding: 10px 15px;
+    background-color: #3498DB;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    cursor: pointer;
+    font-size: 13px;
+    font-weight: bold;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+    z-index: 1000;
+}
+#toggle-filter-btn:hover {
+    background-color: #2980B9;
+}
+#highlight-mode-toggle {
+    position: static;
+    padding: 8px 12px;
+    background-color: #9B59B6;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    cursor: pointer;
+    font-size: 12px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+}
+#highlight-mode-toggle:hover {
+    background-color: #8E44AD;
+}
+#highlight-mode-toggle.directional {
+    background-color: #E67E22;
+}
+#highlight-mode-toggle.directional:hover {
+    background-color: #D35400;
+}
+#stats {
+    background-color: #34495E;
+    color: white;
+    padding: 8px 20px;
+    display: flex;
+    justify-content: center;
+    gap: 40px;
+    font-size: 13px;
+}
+#mynetwork {
+    width: 100%;
+    height: calc(100vh - 140px);
+    border: 1px solid #ddd;
+    background-color: white;
+}
+#info-panel {
+    position: fixed;
+    right: 20px;
+    top: 140px;
+    width: 320px;
+    background: white;
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    padding: 15px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    max-height: calc(100vh - 160px);
+    overflow-y: auto;
+    display: none;
+    z-index: 2000;
+}
+#info-panel h3 {
+    margin-top: 0;
+    color: #2C3E50;
+    border-bottom: 2px solid #3498DB;
+    padding-bottom: 10px;
+}
+#info-panel .close-btn {
+    float: right;
+    cursor: pointer;
+    color: #999;
+    font-size: 20px;
+    font-weight: bold;
+    line-height: 20px;
+}
+#info-panel .close-btn:hover {
+    color: #333;
+}
+.relationship-item {
+    margin: 10px 0;
+    padding: 10px;
+    background-color: #f8f9fa;
+    border-left: 3px solid #3498DB;
+    border-radius: 4px;
+}
+.relationship-item.inactive {
+    border-left-color: #999;
+    opacity: 0.7;
+}
+.relationship-item strong {
+    color: #2C3E50;
+}
+.relationship-item .detail {
+    font-size: 12px;
+    color: #666;
+    margin-top: 5px;
+}
+.legend {
+    background-color: white;
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    padding: 10px 20px;
+    margin: 10px 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    display: flex;
+    align-items: center;
+    gap: 25px;
+    flex-wrap: wrap;
+}
+.legend h3 {
+    margin: 0;
+    color: #2C3E50;
+    font-size: 16px;
+}
+.legend-item {
+    display: flex;
+    align-items: center;
+    font-size: 13px;
+}
+.legend-color {
+    width: 30px;
+    height: 20px;
+    margin-right: 10px;
+    border: 1px solid #333;
+    border-radius: 3px;
+}
+.legend-color.fact {
+    background-color: #FF6B6B;
+}
+.legend-color.dim {
+    background-color: #4ECDC4;
+    border-radius: 50%;
+}
+.legend-line {
+    width: 30px;
+    height: 2px;
+    margin-right: 10px;
+}
+.legend-line.normal {
+    background-color: #2C3E50;
+}
+.legend-line.bidirectional {
+    background-color: #8E44AD;
+    height: 3px;
+}
+.legend-line.inactive {
+    background-color: #999;
+    border-top: 2px dashed #999;
+    height: 0;
+}
+.instructions {
+    background-color: #FFF3CD;
+    border: 1px solid #FFE69C;
+    border-radius: 8px;
+    padding: 10px 20px;
+    margin: 10px 20px;
+    color: #856404;
+    font-size: 13px;
+}
+.instructions strong {
+    display: inline;
+    margin-right: 8px;
+    font-size: 14px;
+}
+"""
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};:,])\s*')
+_LINE_INDENT_RE = re.compile(r'\s*\n\s*')
+
+
+def _minify_css(css):
+    """Strip comments and collapse whitespace in a stylesheet"""
+    css = _CSS_SPACE_RE.sub(' ', _CSS_COMMENT_RE.sub('', css))
+    return _CSS_PUNCT_RE.sub(r'\1', css).strip()
+
+
+def _minify_html(text):
+    """Drop indentation and blank lines; line breaks are kept so // comments in inline JS stay safe"""
+    return _LINE_INDENT_RE.sub('\n', text).strip()
+
 
 def parse_tmdl_relationships(file_path):
     """Parse relationships.tmdl file and extract relationship definitions"""
@@ -36,49 +531,40 @@ def parse_tmdl_relationships(file_path):
         print(f"    ✗ Error reading file {file_path}: {e}")
         return []
     
-    if not content.strip():
+    # Cheap substring check: skips the regex work for empty or unrelated files
+    if 'relationship' not in content:
         return []
     
     relationships = []
     
     # Split by relationship blocks
-    blocks = re.split(r'(?:^|\n)relationship\s+[\w-]+\n', content, flags=re.MULTILINE)
-    rel_ids = re.findall(r'(?:^|\n)relationship\s+([\w-]+)\n', content, flags=re.MULTILINE)
+    blocks = _REL_SPLIT_RE.split(content)
+    rel_ids = _REL_ID_RE.findall(content)
     
     for i, block in enumerate(blocks[1:], 0):  # Skip first empty block
         rel = {'id': rel_ids[i] if i < len(rel_ids) else f'rel_{i}'}
         
-        # Extract properties
-        from_col_match = re.search(r'fromColumn:\s*(.+)', block)
-        to_col_match = re.search(r'toColumn:\s*(.+)', block)
-        from_card_match = re.search(r'fromCardinality:\s*(\w+)', block)
-        to_card_match = re.search(r'toCardinality:\s*(\w+)', block)
-        cross_filter_match = re.search(r'crossFilteringBehavior:\s*(\w+)', block)
-        is_active_match = re.search(r'isActive:\s*(\w+)', block)
+        # Extract properties (first occurrence wins)
+        props = {}
+        for key, value in _KV_RE.findall(block):
+            props.setdefault(key, value)
         
-        if from_col_match and to_col_match:
-            from_full = from_col_match.group(1).strip()
-            to_full = to_col_match.group(1).strip()
-            
-            # Parse table.column format
-            from_parts = from_full.split('.')
-            to_parts = to_full.split('.')
-            
-            # Handle quoted table names
-            from_table = from_parts[0].strip("'\"")
-            from_column = '.'.join(from_parts[1:]).strip("'\"") if len(from_parts) > 1 else ''
-            
-            to_table = to_parts[0].strip("'\"")
-            to_column = '.'.join(to_parts[1:]).strip("'\"") if len(to_parts) > 1 else ''
+        from_full = props.get('fromColumn')
+        to_full = props.get('toColumn')
+        
+        if from_full and to_full:
+            # Parse table.column format (quoted names included)
+            from_table, from_column = _TABLE_COL_RE.match(from_full).groups('')
+            to_table, to_column = _TABLE_COL_RE.match(to_full).groups('')
             
             rel['from_table'] = from_table
             rel['from_column'] = from_column
             rel['to_table'] = to_table
             rel['to_column'] = to_column
-            rel['from_cardinality'] = from_card_match.group(1) if from_card_match else 'many'
-            rel['to_cardinality'] = to_card_match.group(1) if to_card_match else 'one'
-            rel['cross_filtering'] = cross_filter_match.group(1) if cross_filter_match else 'oneDirection'
-            rel['is_active'] = is_active_match.group(1).lower() != 'false' if is_active_match else True
+            rel['from_cardinality'] = props.get('fromCardinality', 'many')
+            rel['to_cardinality'] = props.get('toCardinality', 'one')
+            rel['cross_filtering'] = props.get('crossFilteringBehavior', 'oneDirection')
+            rel['is_active'] = props.get('isActive', 'true').lower() != 'false'
             
             relationships.append(rel)
     
@@ -101,15 +587,13 @@ def prepare_model_data(relationships, model_name):
         
         # Add nodes if not exists
         if from_table not in nodes:
-            nodes[from_table] = {'id': from_table, 'label': from_table, 'connections': []}
+            nodes[from_table] = {'id': from_table, 'label': from_table, 'connections': set()}
         if to_table not in nodes:
-            nodes[to_table] = {'id': to_table, 'label': to_table, 'connections': []}
+            nodes[to_table] = {'id': to_table, 'label': to_table, 'connections': set()}
         
         # Track connections
-        if to_table not in nodes[from_table]['connections']:
-            nodes[from_table]['connections'].append(to_table)
-        if from_table not in nodes[to_table]['connections']:
-            nodes[to_table]['connections'].append(from_table)
+        nodes[from_table]['connections'].add(to_table)
+        nodes[to_table]['connections'].add(from_table)
         
         # Create edge
         # Note: In Power BI, filter direction flows FROM dimension (one-side) TO fact (many-side)
@@ -123,7 +607,6 @@ def prepare_model_data(relationships, model_name):
             'from': to_table,
             'to': from_table,
             'label': f"{cardinality} {direction}{active_text}",
-            'title': f"{to_table}.{rel['to_column']} → {from_table}.{rel['from_column']}",
             'arrows': 'to' if rel['cross_filtering'] != 'bothDirections' else 'to, from',
             'dashes': not rel['is_active'],
             'color': '#8E44AD' if rel['cross_filtering'] == 'bothDirections' else ('#999999' if not rel['is_active'] else '#2C3E50'),
@@ -137,340 +620,103 @@ def prepare_model_data(relationships, model_name):
         edges.append(edge)
     
     # Classify tables
-    fact_tables = [t for t, stats in table_stats.items() if stats['outgoing'] > stats['incoming']]
+    fact_set = {t for t, stats in table_stats.items() if stats['outgoing'] > stats['incoming']}
     
-    # Prepare nodes for vis.js
-    vis_nodes = []
-    for table_name, node_data in nodes.items():
-        is_fact = table_name in fact_tables
-        vis_node = {
-            'id': table_name,
-            'label': table_name,
-            'title': f"{table_name}\n{'Fact Table' if is_fact else 'Dimension Table'}\nConnections: {len(node_data['connections'])}",
-            'color': {
-                'background': '#FF6B6B' if is_fact else '#4ECDC4',
-                'border': '#C44545' if is_fact else '#3BA39F',
-                'highlight': {
-                    'background': '#FF8787' if is_fact else '#6FE8DE',
-                    'border': '#A03333' if is_fact else '#2A7A77'
-                }
-            },
-            'shape': 'box' if is_fact else 'ellipse',
-            'font': {'size': 14, 'color': '#000000', 'bold': True},
-            'connections': node_data['connections']
-        }
-        vis_nodes.append(vis_node)
+    # Pool table names: each name is emitted once and referenced by index.
+    # The page rebuilds vis.js nodes/edges (ids, labels, titles, styling) from this.
+    tables = sorted(nodes)
+    name_to_id = {name: i for i, name in enumerate(tables)}
+    for edge in edges:
+        edge['f'] = name_to_id[edge.pop('from')]
+        edge['t'] = name_to_id[edge.pop('to')]
     
-    return {
-        'nodes': vis_nodes,
+    model_data = {
+        'tables': tables,
+        'nodes': {
+            'is_fact': [name in fact_set for name in tables],
+            'connections': [sorted(name_to_id[c] for c in nodes[name]['connections']) for name in tables]
+        },
         'edges': edges,
         'stats': {
             'tables': len(nodes),
             'relationships': len(relationships),
-            'facts': len(fact_tables),
-            'dimensions': len(nodes) - len(fact_tables)
+            'facts': len(fact_set),
+            'dimensions': len(nodes) - len(fact_set)
         }
     }
+    
+    groups = _aggregate(tables, edges)
+    if groups:
+        model_data['groups'] = groups
+    
+    return model_data
+
+
+def _aggregate(tables, edges, threshold=AGGREGATE_THRESHOLD):
+    """Collapse a model with more than threshold tables into table-name prefix groups
+    
+    Returns None for smaller models. Otherwise returns group names, the table
+    indices in each group and count-weighted edges between groups; the page
+    shows this overview first and expands a group into its tables on click.
+    """
+    if len(tables) <= threshold:
+        return None
+    
+    group_index = {}
+    names = []
+    members = []
+    table_group = []
+    for i, name in enumerate(tables):
+        prefix = _GROUP_PREFIX_RE.split(name, 1)[0] or name
+        gi = group_index.get(prefix)
+        if gi is None:
+            gi = group_index[prefix] = len(names)
+            names.append(prefix)
+            members.append([])
+        members[gi].append(i)
+        table_group.append(gi)
+    
+    counts = defaultdict(int)
+    for edge in edges:
+        a, b = table_group[edge['f']], table_group[edge['t']]
+        if a != b:
+            counts[(a, b)] += 1
+    
+    return {
+        'names': names,
+        'members': members,
+        'edges': [[a, b, n] for (a, b), n in sorted(counts.items())]
+    }
 
 
-def create_multi_model_html(models_data, output_path):
-    """Create an interactive HTML with dropdown to select models"""
+def create_multi_model_html(models_data, output_path, renderer='visjs'):
+    """Create an interactive HTML with dropdown to select models
+    
+    renderer is 'visjs' (canvas, default) or 'sigma' (WebGL, for very large models).
+    """
+    renderer_scripts = _RENDERER_SCRIPTS[renderer]
+    renderer_facade = _SIGMA_FACADE_JS if renderer == 'sigma' else ''
+    css = _minify_css(_CSS)
     
-    # Create JavaScript object with all models data
-    models_json = json.dumps(models_data)
+    # One gzip + base64 data block per model. The blocks don't execute; the page
+    # inflates a model with DecompressionStream the first time it is selected.
+    model_blocks = []
+    for model_name, model in models_data.items():
+        model_json = json.dumps(model, separators=(',', ':'))
+        blob = base64.b64encode(gzip.compress(model_json.encode('utf-8'))).decode('ascii')
+        model_blocks.append(
+            f'<script type="application/octet-stream" class="model-data" '
+            f'data-model="{html.escape(model_name, quote=True)}">{blob}</script>'
+        )
+    model_blocks = '\n    '.join(model_blocks)
     
     html_content = f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Power BI Semantic Models - Relationship Diagrams</title>
-    <script type="text/javascript" src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>
+    {renderer_scripts}
     <style type="text/css">
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background-color: #f5f5f5;
-        }}
-        #header {{
-            background-color: #2C3E50;
-            color: white;
-            padding: 15px 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        #header h1 {{
-            margin: 0;
-            font-size: 24px;
-        }}
-        #model-selector {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        #model-selector label {{
-            font-size: 14px;
-            font-weight: bold;
-        }}
-        #model-selector select {{
-            padding: 8px 12px;
-            font-size: 14px;
-            border: none;
-            border-radius: 4px;
-            background-color: white;
-            color: #2C3E50;
-            cursor: pointer;
-            min-width: 300px;
-        }}
-        #table-filter {{
-            position: fixed;
-            left: 20px;
-            top: 140px;
-            width: 280px;
-            background: white;
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            padding: 15px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            max-height: calc(100vh - 160px);
-            overflow-y: auto;
-            display: none;
-            z-index: 2000;
-        }}
-        #table-filter h3 {{
-            margin-top: 0;
-            color: #2C3E50;
-            border-bottom: 2px solid #3498DB;
-            padding-bottom: 10px;
-            font-size: 16px;
-        }}
-        #table-filter .close-btn {{
-            float: right;
-            cursor: pointer;
-            color: #999;
-            font-size: 20px;
-            font-weight: bold;
-            line-height: 20px;
-        }}
-        #table-filter .close-btn:hover {{
-            color: #333;
-        }}
-        #table-filter .filter-controls {{
-            margin-bottom: 10px;
-            display: flex;
-            gap: 8px;
-        }}
-        #table-filter .filter-controls button {{
-            padding: 6px 12px;
-            font-size: 12px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            background-color: #f8f9fa;
-            cursor: pointer;
-            flex: 1;
-        }}
-        #table-filter .filter-controls button:hover {{
-            background-color: #e9ecef;
-        }}
-        #table-filter .table-list {{
-            max-height: calc(100vh - 260px);
-            overflow-y: auto;
-        }}
-        #table-filter .table-item {{
-            display: flex;
-            align-items: center;
-            padding: 6px;
-            margin: 4px 0;
-            cursor: pointer;
-            border-radius: 4px;
-            font-size: 13px;
-        }}
-        #table-filter .table-item:hover {{
-            background-color: #f8f9fa;
-        }}
-        #table-filter .table-item input[type="checkbox"] {{
-            margin-right: 8px;
-            cursor: pointer;
-        }}
-        #table-filter .table-item.fact {{
-            color: #C44545;
-            font-weight: 500;
-        }}
-        #table-filter .table-item.dim {{
-            color: #3BA39F;
-        }}
-        #toggle-filter-btn {{
-            position: fixed;
-            left: 20px;
-            top: 140px;
-            padding: 10px 15px;
-            background-color: #3498DB;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 13px;
-            font-weight: bold;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            z-index: 1000;
-        }}
-        #toggle-filter-btn:hover {{
-            background-color: #2980B9;
-        }}
-        #highlight-mode-toggle {{
-            position: static;
-            padding: 8px 12px;
-            background-color: #9B59B6;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 12px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-        }}
-        #highlight-mode-toggle:hover {{
-            background-color: #8E44AD;
-        }}
-        #highlight-mode-toggle.directional {{
-            background-color: #E67E22;
-        }}
-        #highlight-mode-toggle.directional:hover {{
-            background-color: #D35400;
-        }}
-        #stats {{
-            background-color: #34495E;
-            color: white;
-            padding: 8px 20px;
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-            font-size: 13px;
-        }}
-        #mynetwork {{
-            width: 100%;
-            height: calc(100vh - 140px);
-            border: 1px solid #ddd;
-            background-color: white;
-        }}
-        #info-panel {{
-            position: fixed;
-            right: 20px;
-            top: 140px;
-            width: 320px;
-            background: white;
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            padding: 15px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            max-height: calc(100vh - 160px);
-            overflow-y: auto;
-            display: none;
-            z-index: 2000;
-        }}
-        #info-panel h3 {{
-            margin-top: 0;
-            color: #2C3E50;
-            border-bottom: 2px solid #3498DB;
-            padding-bottom: 10px;
-        }}
-        #info-panel .close-btn {{
-            float: right;
-            cursor: pointer;
-            color: #999;
-            font-size: 20px;
-            font-weight: bold;
-            line-height: 20px;
-        }}
-        #info-panel .close-btn:hover {{
-            color: #333;
-        }}
-        .relationship-item {{
-            margin: 10px 0;
-            padding: 10px;
-            background-color: #f8f9fa;
-            border-left: 3px solid #3498DB;
-            border-radius: 4px;
-        }}
-        .relationship-item.inactive {{
-            border-left-color: #999;
-            opacity: 0.7;
-        }}
-        .relationship-item strong {{
-            color: #2C3E50;
-        }}
-        .relationship-item .detail {{
-            font-size: 12px;
-            color: #666;
-            margin-top: 5px;
-        }}
-        .legend {{
-            background-color: white;
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            padding: 10px 20px;
-            margin: 10px 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            display: flex;
-            align-items: center;
-            gap: 25px;
-            flex-wrap: wrap;
-        }}
-        .legend h3 {{
-            margin: 0;
-            color: #2C3E50;
-            font-size: 16px;
-        }}
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            font-size: 13px;
-        }}
-        .legend-color {{
-            width: 30px;
-            height: 20px;
-            margin-right: 10px;
-            border: 1px solid #333;
-            border-radius: 3px;
-        }}
-        .legend-color.fact {{
-            background-color: #FF6B6B;
-        }}
-        .legend-color.dim {{
-            background-color: #4ECDC4;
-            border-radius: 50%;
-        }}
-        .legend-line {{
-            width: 30px;
-            height: 2px;
-            margin-right: 10px;
-        }}
-        .legend-line.normal {{
-            background-color: #2C3E50;
-        }}
-        .legend-line.bidirectional {{
-            background-color: #8E44AD;
-            height: 3px;
-        }}
-        .legend-line.inactive {{
-            background-color: #999;
-            border-top: 2px dashed #999;
-            height: 0;
-        }}
-        .instructions {{
-            background-color: #FFF3CD;
-            border: 1px solid #FFE69C;
-            border-radius: 8px;
-            padding: 10px 20px;
-            margin: 10px 20px;
-            color: #856404;
-            font-size: 13px;
-        }}
-        .instructions strong {{
-            display: inline;
-            margin-right: 8px;
-            font-size: 14px;
-        }}
+        {css}
     </style>
 </head>
 <body>
@@ -530,6 +776,7 @@ def create_multi_model_html(models_data, output_path):
         <div class="filter-controls">
             <button onclick="selectAllTables()">Select All</button>
             <button onclick="deselectAllTables()">Deselect All</button>
+            <button id="group-overview-btn" onclick="loadModel(currentModelName)" style="display: none;" title="Back to the table-group overview">Groups</button>
         </div>
         <div class="table-list" id="table-list"></div>
     </div>
@@ -541,35 +788,187 @@ def create_multi_model_html(models_data, output_path):
         <h3 id="selected-table-name">Table Information</h3>
         <div id="relationships-list"></div>
     </div>
-
+{renderer_facade}
+    {model_blocks}
+    
     <script type="text/javascript">
-        // All models data
-        const modelsData = {models_json};
+        // Per-model data blocks (gzip-compressed JSON), decoded on first selection
+        const modelBlocks = {{}};
+        document.querySelectorAll('script.model-data').forEach(el => {{
+            modelBlocks[el.dataset.model] = el;
+        }});
+        const modelsData = {{}};
+        let loadToken = 0;
         
         let network = null;
         let nodes = null;
         let edges = null;
         let currentModelData = null;
         let selectedNode = null;
-        let visibleTables = new Set();
+        let visibleBits = new Uint8Array(0);  // table index -> 1 when shown by the filter
         let allNodesData = [];
         let allEdgesData = [];
+        let sortedNodesData = [];
+        let nodesById = new Map();  // table name -> node
+        let adjByNode = new Map();  // table name -> ids of the edges touching it
+        let edgeIndex = new Map();  // table name -> {{outgoing, incoming}} edges
+        let edgeFrom = new Int32Array(0);  // edge id -> source table index
+        let edgeTo = new Int32Array(0);    // edge id -> target table index
+        let outAdj = new Map();     // table name -> tables it filters
+        let inAdj = new Map();      // table name -> tables that filter it
+        const builtCache = {{}};  // model name -> hydrated {{nodes, edges}}
+        const positionsCache = {{}};  // model name -> stabilized {{id: {{x, y}}}}
+        let currentModelName = null;
+        let aggregatedView = false;  // true while an oversized model shows its group overview
+        let groupMembers = new Map();  // group node id -> table names
+        const checkboxByNode = new Map();  // table name -> its filter panel checkbox
+        let shownBits = null;  // tables currently in the node dataset; null while it holds the group overview
+        const addedNodesArr = [];  // reused by updateVisibleTables instead of reallocating per toggle
+        const addedEdgesArr = [];
+        
+        // Node styling, applied client-side from each node's is_fact flag
+        const NODE_STYLES = {{
+            fact: {{
+                color: {{
+                    background: '#FF6B6B',
+                    border: '#C44545',
+                    highlight: {{ background: '#FF8787', border: '#A03333' }}
+                }},
+                shape: 'box'
+            }},
+            dimension: {{
+                color: {{
+                    background: '#4ECDC4',
+                    border: '#3BA39F',
+                    highlight: {{ background: '#6FE8DE', border: '#2A7A77' }}
+                }},
+                shape: 'ellipse'
+            }}
+        }};
+        const NODE_FONT = {{ size: 14, color: '#000000', bold: true }};
+        const GROUP_NODE_COLOR = {{
+            background: '#F4A261',
+            border: '#C47A3A',
+            highlight: {{ background: '#F7B882', border: '#9C5D2A' }}
+        }};
+        const HTML_ESCAPES = {{ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }};
+        const DEBUG = false;  // set to true to trace filter changes in the browser console
+        const ANIMATED_FIT_MAX_NODES = 200;  // larger graphs jump straight to the fitted view
+        const FILTER_DEBOUNCE_MS = 50;  // rapid checkbox toggles coalesce into one network update
+        const DIMMED_NODE_COLOR = {{
+            background: '#E0E0E0',
+            border: '#BDBDBD',
+            highlight: {{ background: '#E0E0E0', border: '#BDBDBD' }}
+        }};
+        
+        function escapeHtml(text) {{
+            return String(text).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+        }}
+        
+        function styleNode(node) {{
+            const style = node.is_fact ? NODE_STYLES.fact : NODE_STYLES.dimension;
+            return Object.assign({{}}, node, {{ color: style.color, shape: style.shape, font: NODE_FONT }});
+        }}
         
-        // Populate dropdown
+        // Expand the pooled model format (table indices) into vis.js nodes and edges
+        function hydrateModel(data) {{
+            const tables = data.tables;
+            const nodeList = tables.map((name, i) => {{
+                const isFact = data.nodes.is_fact[i];
+                const connections = data.nodes.connections[i].map(j => tables[j]);
+                return styleNode({{
+                    id: name,
+                    label: name,
+                    title: name + '\\n' + (isFact ? 'Fact Table' : 'Dimension Table') + '\\nConnections: ' + connections.length,
+                    index: i,
+                    is_fact: isFact,
+                    connections: connections,
+                    checkboxId: 'table-' + name.replace(/[^a-zA-Z0-9]/g, '_')  // filter panel element id
+                }});
+            }});
+            // Edge ids are their index, so an edge can be updated without searching for it
+            // outAdj/inAdj hold neighboring table names in filter direction for the BFS
+            const adjByNode = new Map(tables.map(name => [name, []]));
+            const outAdj = new Map(tables.map(name => [name, []]));
+            const inAdj = new Map(tables.map(name => [name, []]));
+            const edgeIndex = new Map(tables.map(name => [name, {{ outgoing: [], incoming: [] }}]));  // info panel rows
+            const edgeFrom = new Int32Array(data.edges.length);  // endpoint table indices by edge id, for the full-graph filter scans
+            const edgeTo = new Int32Array(data.edges.length);
+            const edgeList = data.edges.map((e, i) => {{
+                const edge = Object.assign({{}}, e, {{ id: i, from: tables[e.f], to: tables[e.t] }});
+                edge.title = edge.from + '.' + e.from_column + ' → ' + edge.to + '.' + e.to_column;
+                adjByNode.get(edge.from).push(i);
+                if (edge.to !== edge.from) adjByNode.get(edge.to).push(i);
+                outAdj.get(edge.from).push(edge.to);
+                inAdj.get(edge.to).push(edge.from);
+                edgeFrom[i] = e.f;
+                edgeTo[i] = e.t;
+                edgeIndex.get(edge.from).outgoing.push(edge);
+                if (edge.to !== edge.from) edgeIndex.get(edge.to).incoming.push(edge);
+                return edge;
+            }});
+            const nodesById = new Map(nodeList.map(n => [n.id, n]));
+            const sortedNodes = nodeList.slice().sort((a, b) => a.id.localeCompare(b.id));  // filter panel order
+            const model = {{ nodes: nodeList, edges: edgeList, sortedNodes: sortedNodes, nodesById: nodesById, adjByNode: adjByNode, edgeIndex: edgeIndex, edgeFrom: edgeFrom, edgeTo: edgeTo, outAdj: outAdj, inAdj: inAdj }};
+            
+            // Oversized models also get a prefix-group overview (one meta-node per group)
+            if (data.groups) {{
+                const groupId = i => 'group:' + data.groups.names[i];
+                model.groupMembers = new Map(data.groups.members.map((m, i) => [groupId(i), m.map(j => tables[j])]));
+                model.groupNodes = data.groups.names.map((name, i) => ({{
+                    id: groupId(i),
+                    label: name + ' (' + data.groups.members[i].length + ')',
+                    title: data.groups.members[i].length + ' tables - click to expand',
+                    value: data.groups.members[i].length,
+                    shape: 'dot',
+                    color: GROUP_NODE_COLOR,
+                    font: NODE_FONT
+                }}));
+                model.groupEdges = data.groups.edges.map(([a, b, count], i) => ({{
+                    id: 'group-edge-' + i,
+                    from: groupId(a),
+                    to: groupId(b),
+                    label: String(count),
+                    arrows: 'to',
+                    color: '#2C3E50',
+                    width: Math.min(1 + Math.log2(count), 8)
+                }}));
+            }}
+            return model;
+        }}
+        
+        async function decodeModelData(blob) {{
+            const bytes = Uint8Array.from(atob(blob), c => c.charCodeAt(0));
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return JSON.parse(await new Response(stream).text());
+        }}
+        
+        // The graph library is deferred; it has run by the time DOMContentLoaded fires
         const select = document.getElementById('model-select');
-        Object.keys(modelsData).sort().forEach(modelName => {{
-            const option = document.createElement('option');
-            option.value = modelName;
-            option.textContent = modelName;
-            select.appendChild(option);
+        document.addEventListener('DOMContentLoaded', () => {{
+            // Populate dropdown
+            const modelNames = Object.keys(modelBlocks).sort();
+            modelNames.forEach(modelName => {{
+                const option = document.createElement('option');
+                option.value = modelName;
+                option.textContent = modelName;
+                select.appendChild(option);
+            }});
+            
+            // Networks are built on demand; only a lone model is loaded up front
+            if (modelNames.length === 1) {{
+                select.value = modelNames[0];
+                loadModel(modelNames[0]);
+            }}
         }});
         
-        // Load first model by default
-        if (Object.keys(modelsData).length > 0) {{
-            const firstModel = Object.keys(modelsData).sort()[0];
-            select.value = firstModel;
-            loadModel(firstModel);
-        }}
+        // Stat counters are rewritten on every filter change
+        const statEls = {{
+            tables: document.getElementById('stat-tables'),
+            relationships: document.getElementById('stat-relationships'),
+            facts: document.getElementById('stat-facts'),
+            dimensions: document.getElementById('stat-dimensions')
+        }};
         
         // Highlight mode toggle
         let highlightDirectional = false;
@@ -581,51 +980,103 @@ def create_multi_model_html(models_data, output_path):
             resetHighlight();
         }});
         
-        function loadModel(modelName) {{
-            if (!modelName || !modelsData[modelName]) return;
+        // One delegated listener serves every filter checkbox, however often the list is rebuilt
+        document.getElementById('table-list').addEventListener('change', e => {{
+            const checkbox = e.target;
+            if (checkbox && checkbox.matches('input[type=checkbox][data-table-id]')) {{
+                toggleTable(checkbox.getAttribute('data-table-id'));
+            }}
+        }});
+        
+        async function loadModel(modelName) {{
+            if (!modelName || !modelBlocks[modelName]) return;
+            
+            // Decode on first use; a newer selection made meanwhile wins
+            const token = ++loadToken;
+            if (!modelsData[modelName]) {{
+                try {{
+                    modelsData[modelName] = await decodeModelData(modelBlocks[modelName].textContent);
+                }} catch (err) {{
+                    console.error('Failed to decode model data:', modelName, err);
+                    return;
+                }}
+                if (token !== loadToken) return;
+            }}
+            
+            // Keep the outgoing model's layout (including any dragging) if it had settled
+            if (network && positionsCache[currentModelName]) {{
+                Object.assign(positionsCache[currentModelName], network.getPositions());
+            }}
             
+            currentModelName = modelName;
             currentModelData = modelsData[modelName];
-            const data = currentModelData.data;
+            if (!builtCache[modelName]) {{
+                builtCache[modelName] = hydrateModel(currentModelData.data);
+            }}
+            const data = builtCache[modelName];
             
             // Store original data
             allNodesData = data.nodes;
             allEdgesData = data.edges;
+            sortedNodesData = data.sortedNodes;
+            nodesById = data.nodesById;
+            adjByNode = data.adjByNode;
+            edgeIndex = data.edgeIndex;
+            edgeFrom = data.edgeFrom;
+            edgeTo = data.edgeTo;
+            outAdj = data.outAdj;
+            inAdj = data.inAdj;
             
             // Initialize all tables as visible
-            visibleTables = new Set(allNodesData.map(n => n.id));
+            visibleBits = new Uint8Array(allNodesData.length).fill(1);
             
             // Update stats
-            document.getElementById('stat-tables').textContent = currentModelData.stats.tables;
-            document.getElementById('stat-relationships').textContent = currentModelData.stats.relationships;
-            document.getElementById('stat-facts').textContent = currentModelData.stats.facts;
-            document.getElementById('stat-dimensions').textContent = currentModelData.stats.dimensions;
+            statEls.tables.textContent = currentModelData.stats.tables;
+            statEls.relationships.textContent = currentModelData.stats.relationships;
+            statEls.facts.textContent = currentModelData.stats.facts;
+            statEls.dimensions.textContent = currentModelData.stats.dimensions;
             
             // Populate table filter list
             populateTableFilter();
             
-            // Create or update network
-            nodes = new vis.DataSet(data.nodes);
-            edges = new vis.DataSet(data.edges);
+            // Oversized models open on the group overview
+            aggregatedView = !!data.groupNodes;
+            groupMembers = data.groupMembers || new Map();
+            document.getElementById('group-overview-btn').style.display = aggregatedView ? '' : 'none';
+            const startNodes = aggregatedView ? data.groupNodes : data.nodes;
+            shownBits = aggregatedView ? null : visibleBits.slice();
+            
+            // Create or update network; a previously stabilized layout is reused as-is
+            const positions = positionsCache[modelName];
+            nodes = new vis.DataSet(positions
+                ? startNodes.map(n => positions[n.id] ? Object.assign({{}}, n, positions[n.id]) : n)
+                : startNodes);
+            edges = new vis.DataSet(aggregatedView ? data.groupEdges : data.edges);
             
             const container = document.getElementById('mynetwork');
             const networkData = {{ nodes: nodes, edges: edges }};
             
+            // Spread larger graphs out instead of iterating longer; overlap avoidance only pays off when small
+            const nodeCount = startNodes.length;
+            const spread = Math.max(1, Math.sqrt(nodeCount / 50));
+            
             const options = {{
                 physics: {{
-                    enabled: true,
+                    enabled: !positions,
                     solver: 'forceAtlas2Based',
                     forceAtlas2Based: {{
-                        gravitationalConstant: -50,
+                        gravitationalConstant: -50 * spread,
                         centralGravity: 0.01,
-                        springLength: 150,
+                        springLength: 150 * spread,
                         springConstant: 0.08,
                         damping: 0.4,
-                        avoidOverlap: 0.5
+                        avoidOverlap: nodeCount <= 100 ? 0.5 : 0
                     }},
                     stabilization: {{
                         enabled: true,
-                        iterations: 200,
-                        updateInterval: 25
+                        iterations: 50,
+                        updateInterval: 50,
+                        fit: true
                     }}
                 }},
                 interaction: {{
@@ -635,10 +1086,8 @@ def create_multi_model_html(models_data, output_path):
                     keyboard: true
                 }},
                 edges: {{
-                    smooth: {{
-                        type: 'continuous',
-                        roundness: 0.5
-                    }},
+                    // Straight edges skip the per-frame bezier computation that dominates redraws on dense graphs
+                    smooth: false,
                     font: {{
                         size: 11,
                         align: 'middle'
@@ -656,11 +1105,24 @@ def create_multi_model_html(models_data, output_path):
             
             network = new vis.Network(container, networkData, options);
             
+            // Physics only runs for the initial layout; re-opened models start from their cached layout
+            const net = network;
+            if (!positions) {{
+                net.once('stabilizationIterationsDone', () => {{
+                    positionsCache[modelName] = net.getPositions();
+                    net.setOptions({{ physics: {{ enabled: false }} }});
+                }});
+            }}
+            
             // Click on node
             network.on('click', function(params) {{
                 if (params.nodes.length > 0) {{
                     const nodeId = params.nodes[0];
-                    selectNode(nodeId);
+                    if (aggregatedView) {{
+                        expandGroup(nodeId);
+                    }} else {{
+                        selectNode(nodeId);
+                    }}
                 }} else {{
                     resetHighlight();
                 }}
@@ -671,12 +1133,12 @@ def create_multi_model_html(models_data, output_path):
         
         function selectNode(nodeId) {{
             selectedNode = nodeId;
-            const nodeData = allNodesData.find(n => n.id === nodeId);
+            const nodeData = nodesById.get(nodeId);
             
             if (!nodeData) return;
             
             // Only work with visible nodes
-            const visibleNodesArray = allNodesData.filter(n => visibleTables.has(n.id));
+            const visibleNodesArray = allNodesData.filter(n => visibleBits[n.index]);
             
             // Get connected nodes (only among visible ones)
             let connectedNodes;
@@ -688,65 +1150,37 @@ def create_multi_model_html(models_data, output_path):
                 const toVisit = [nodeId];
                 const visited = new Set([nodeId]);
                 
-                while (toVisit.length > 0) {{
-                    const current = toVisit.shift();
-                    allEdgesData.forEach(e => {{
-                        // Follow outgoing edges: current table filters another table
-                        if (e.from === current && visibleTables.has(e.to) && !visited.has(e.to)) {{
-                            connectedNodes.add(e.to);
-                            visited.add(e.to);
-                            toVisit.push(e.to);
+                // Index-based dequeue: shift() would make the BFS quadratic on wide models
+                let head = 0;
+                while (head < toVisit.length) {{
+                    const current = toVisit[head++];
+                    const follow = next => {{
+                        if (isTableVisible(next) && !visited.has(next)) {{
+                            connectedNodes.add(next);
+                            visited.add(next);
+                            toVisit.push(next);
                         }}
-                        // Follow incoming edges: another table filters current table
-                        if (e.to === current && visibleTables.has(e.from) && !visited.has(e.from)) {{
-                            connectedNodes.add(e.from);
-                            visited.add(e.from);
-                            toVisit.push(e.from);
-                        }}
-                    }});
+                    }};
+                    // Follow outgoing edges: current table filters another table
+                    outAdj.get(current).forEach(follow);
+                    // Follow incoming edges: another table filters current table
+                    inAdj.get(current).forEach(follow);
                 }}
             }} else {{
                 // Original behavior: all connections
-                connectedNodes = new Set(nodeData.connections.filter(c => visibleTables.has(c)));
+                connectedNodes = new Set(nodeData.connections.filter(isTableVisible));
             }}
             connectedNodes.add(nodeId);
             
-            // Update node styles (only for visible nodes)
-            visibleNodesArray.forEach(node => {{
-                if (connectedNodes.has(node.id)) {{
-                    nodes.update({{
-                        id: node.id,
-                        color: node.color,
-                        opacity: 1
-                    }});
-                }} else {{
-                    nodes.update({{
-                        id: node.id,
-                        color: {{
-                            background: '#E0E0E0',
-                            border: '#BDBDBD',
-                            highlight: {{
-                                background: '#E0E0E0',
-                                border: '#BDBDBD'
-                            }}
-                        }},
-                        opacity: 0.3
-                    }});
-                }}
-            }});
+            // Update node styles (only for visible nodes) in a single batch
+            nodes.update(visibleNodesArray.map(node => connectedNodes.has(node.id)
+                ? {{ id: node.id, color: node.color, opacity: 1 }}
+                : {{ id: node.id, color: DIMMED_NODE_COLOR, opacity: 0.3 }}
+            ));
             
             // Update edge styles (only for visible edges)
-            const visibleEdgesArray = allEdgesData.filter(e => 
-                visibleTables.has(e.from) && visibleTables.has(e.to)
-            );
-            
-            const relatedEdges = allEdgesData.filter(e => 
-                (e.from === nodeId || e.to === nodeId) && 
-                visibleTables.has(e.from) && visibleTables.has(e.to)
-            );
-            
-            const currentEdges = edges.get();
-            visibleEdgesArray.forEach(edge => {{
+            const edgeUpdates = visibleEdgeIds().map(id => {{
+                const edge = allEdgesData[id];
                 let isRelated;
                 if (highlightDirectional) {{
                     // Highlight edges in the filter chain
@@ -757,87 +1191,114 @@ def create_multi_model_html(models_data, output_path):
                     isRelated = edge.from === nodeId || edge.to === nodeId;
                 }}
                 
-                const edgeInGraph = currentEdges.find(e => 
-                    e.from === edge.from && e.to === edge.to
-                );
-                if (edgeInGraph) {{
-                    edges.update({{
-                        id: edgeInGraph.id,
-                        color: isRelated ? edge.color : '#E0E0E0',
-                        width: isRelated ? edge.width : 1,
-                        opacity: isRelated ? 1 : 0.2
-                    }});
-                }}
+                return {{
+                    id: id,
+                    color: isRelated ? edge.color : '#E0E0E0',
+                    width: isRelated ? edge.width : 1,
+                    opacity: isRelated ? 1 : 0.2
+                }};
             }});
+            edges.update(edgeUpdates);
             
             // Show info panel (always show all relationships regardless of mode)
-            showInfoPanel(nodeId, relatedEdges);
+            const related = edgeIndex.get(nodeId);
+            showInfoPanel(
+                nodeId,
+                related.outgoing.filter(e => visibleBits[edgeTo[e.id]]),
+                related.incoming.filter(e => visibleBits[edgeFrom[e.id]])
+            );
+        }}
+        
+        function isTableVisible(name) {{
+            const node = nodesById.get(name);
+            return !!node && visibleBits[node.index] === 1;
+        }}
+        
+        // Ids of the edges with both tables visible, from an index scan over the endpoint arrays
+        function visibleEdgeIds() {{
+            const ids = [];
+            for (let i = 0; i < edgeFrom.length; i++) {{
+                if (visibleBits[edgeFrom[i]] & visibleBits[edgeTo[i]]) ids.push(i);
+            }}
+            return ids;
+        }}
+        
+        function expandGroup(groupId) {{
+            if (!groupMembers.has(groupId)) return;
+            visibleBits.fill(0);
+            groupMembers.get(groupId).forEach(name => {{ visibleBits[nodesById.get(name).index] = 1; }});
+            updateTableCheckboxes();
+            updateVisibleTables();
         }}
         
         function resetHighlight() {{
             selectedNode = null;
+            if (aggregatedView) {{
+                closeInfoPanel();
+                return;
+            }}
             
             // Only restore visible nodes
-            const visibleNodesArray = allNodesData.filter(n => visibleTables.has(n.id));
-            visibleNodesArray.forEach(node => {{
-                nodes.update({{
-                    id: node.id,
-                    color: node.color,
-                    opacity: 1
-                }});
-            }});
+            const visibleNodesArray = allNodesData.filter(n => visibleBits[n.index]);
+            nodes.update(visibleNodesArray.map(node => ({{
+                id: node.id,
+                color: node.color,
+                opacity: 1
+            }})));
             
             // Only restore visible edges
-            const visibleEdgesArray = allEdgesData.filter(e => 
-                visibleTables.has(e.from) && visibleTables.has(e.to)
-            );
-            const currentEdges = edges.get();
-            visibleEdgesArray.forEach(edge => {{
-                const edgeInGraph = currentEdges.find(e => 
-                    e.from === edge.from && e.to === edge.to
-                );
-                if (edgeInGraph) {{
-                    edges.update({{
-                        id: edgeInGraph.id,
-                        color: edge.color,
-                        width: edge.width,
-                        opacity: 1
-                    }});
-                }}
-            }});
+            edges.update(visibleEdgeIds().map(id => ({{
+                id: id,
+                color: allEdgesData[id].color,
+                width: allEdgesData[id].width,
+                opacity: 1
+            }})));
             
             closeInfoPanel();
         }}
         
-        function showInfoPanel(nodeId, relatedEdges) {{
+        function showInfoPanel(nodeId, outgoing, incoming) {{
             const panel = document.getElementById('info-panel');
             const tableName = document.getElementById('selected-table-name');
             const relationshipsList = document.getElementById('relationships-list');
             
             tableName.textContent = nodeId;
             
-            let html = '<div style="margin-bottom: 15px; color: #666;">' + 
-                       '<strong>' + relatedEdges.length + '</strong> direct relationship(s)</div>';
+            // Built with the element API: no HTML parsing, and column names are never interpreted as markup
+            const frag = document.createDocumentFragment();
+            const summary = document.createElement('div');
+            summary.style.marginBottom = '15px';
+            summary.style.color = '#666';
+            const count = document.createElement('strong');
+            count.textContent = outgoing.length + incoming.length;
+            summary.append(count, ' direct relationship(s)');
+            frag.appendChild(summary);
             
-            relatedEdges.forEach(edge => {{
-                const isOutgoing = edge.from === nodeId;
-                const otherTable = isOutgoing ? edge.to : edge.from;
-                const direction = edge.arrows === 'to, from' ? '↔' : (isOutgoing ? '→' : '←');
-                const inactiveClass = edge.is_active ? '' : ' inactive';
-                
-                html += '<div class="relationship-item' + inactiveClass + '">';
-                html += '<strong>' + direction + ' ' + otherTable + '</strong>';
-                html += '<div class="detail">';
-                html += 'Cardinality: ' + edge.cardinality + '<br>';
-                html += (isOutgoing ? nodeId : otherTable) + '.' + edge.from_column + 
-                       ' → ' + (isOutgoing ? otherTable : nodeId) + '.' + edge.to_column;
+            const addRow = (edge, otherTable, arrow, fromTable, toTable) => {{
+                const item = document.createElement('div');
+                item.className = edge.is_active ? 'relationship-item' : 'relationship-item inactive';
+                const title = document.createElement('strong');
+                title.textContent = (edge.arrows === 'to, from' ? '↔' : arrow) + ' ' + otherTable;
+                const detail = document.createElement('div');
+                detail.className = 'detail';
+                detail.append(
+                    'Cardinality: ' + edge.cardinality,
+                    document.createElement('br'),
+                    fromTable + '.' + edge.from_column + ' → ' + toTable + '.' + edge.to_column
+                );
                 if (!edge.is_active) {{
-                    html += '<br><em>Inactive</em>';
+                    const inactive = document.createElement('em');
+                    inactive.textContent = 'Inactive';
+                    detail.append(document.createElement('br'), inactive);
                 }}
-                html += '</div></div>';
-            }});
+                item.append(title, detail);
+                frag.appendChild(item);
+            }};
+            outgoing.forEach(edge => addRow(edge, edge.to, '→', nodeId, edge.to));
+            incoming.forEach(edge => addRow(edge, edge.from, '←', edge.from, nodeId));
             
-            relationshipsList.innerHTML = html;
+            relationshipsList.textContent = '';
+            relationshipsList.appendChild(frag);
             panel.style.display = 'block';
         }}
         
@@ -861,138 +1322,205 @@ def create_multi_model_html(models_data, output_path):
             const tableList = document.getElementById('table-list');
             if (!tableList) return;
             
-            tableList.innerHTML = '';
+            tableList.textContent = '';
+            checkboxByNode.clear();
             
-            // Get fact tables
-            const factTables = allNodesData.filter(n => n.shape === 'box').map(n => n.id);
-            
-            // Sort tables alphabetically
-            const sortedTables = [...allNodesData].sort((a, b) => a.id.localeCompare(b.id));
-            
-            sortedTables.forEach(node => {{
-                const isFact = factTables.includes(node.id);
-                const div = document.createElement('div');
-                div.className = 'table-item ' + (isFact ? 'fact' : 'dim');
-                
-                const checkbox = document.createElement('input');
-                checkbox.type = 'checkbox';
-                checkbox.id = 'table-' + node.id.replace(/[^a-zA-Z0-9]/g, '_');
-                checkbox.checked = visibleTables.has(node.id);
-                checkbox.setAttribute('data-table-id', node.id);
-                
-                const label = document.createElement('label');
-                label.textContent = node.id;
-                label.style.cursor = 'pointer';
-                label.setAttribute('for', checkbox.id);
-                
-                div.appendChild(checkbox);
-                div.appendChild(label);
-                tableList.appendChild(div);
-            }});
+            // Tables alphabetically, sorted once per model when it was hydrated; the list is parsed in one go
+            const rows = sortedNodesData.map(node =>
+                `<div class="table-item ${{node.is_fact ? 'fact' : 'dim'}}">` +
+                `<input type="checkbox" id="${{node.checkboxId}}" data-table-id="${{escapeHtml(node.id)}}"${{visibleBits[node.index] ? ' checked' : ''}}>` +
+                `<label for="${{node.checkboxId}}">${{escapeHtml(node.id)}}</label></div>`
+            );
+            tableList.insertAdjacentHTML('beforeend', rows.join(''));
             
-            // Add event listeners after all elements are created
-            sortedTables.forEach(node => {{
-                const checkboxId = 'table-' + node.id.replace(/[^a-zA-Z0-9]/g, '_');
-                const checkbox = document.getElementById(checkboxId);
-                console.log('Looking for checkbox:', checkboxId, 'Found:', checkbox);
-                if (checkbox) {{
-                    checkbox.addEventListener('change', function() {{
-                        const tableId = this.getAttribute('data-table-id');
-                        console.log('Checkbox changed for:', tableId);
-                        toggleTable(tableId);
-                    }});
-                }} else {{
-                    console.error('Checkbox not found for table:', node.id);
-                }}
+            tableList.querySelectorAll('input[data-table-id]').forEach((checkbox, i) => {{
+                checkboxByNode.set(sortedNodesData[i].id, checkbox);
             }});
         }}
         
         function toggleTable(tableId) {{
-            console.log('toggleTable called for:', tableId);
-            if (visibleTables.has(tableId)) {{
-                visibleTables.delete(tableId);
-                console.log('Removed table:', tableId);
-            }} else {{
-                visibleTables.add(tableId);
-                console.log('Added table:', tableId);
-            }}
-            updateVisibleTables();
+            if (DEBUG) console.log('toggleTable called for:', tableId);
+            const node = nodesById.get(tableId);
+            if (!node) return;
+            visibleBits[node.index] ^= 1;
+            if (DEBUG) console.log(visibleBits[node.index] ? 'Added table:' : 'Removed table:', tableId);
+            scheduleVisibleUpdate();
+        }}
+        
+        let visibleUpdateTimer = null;
+        function scheduleVisibleUpdate() {{
+            clearTimeout(visibleUpdateTimer);
+            visibleUpdateTimer = setTimeout(() => {{
+                visibleUpdateTimer = null;
+                updateVisibleTables();
+            }}, FILTER_DEBOUNCE_MS);
         }}
         
         function selectAllTables() {{
-            visibleTables = new Set(allNodesData.map(n => n.id));
+            visibleBits.fill(1);
             updateTableCheckboxes();
-            updateVisibleTables();
+            scheduleVisibleUpdate();
         }}
         
         function deselectAllTables() {{
-            visibleTables.clear();
+            visibleBits.fill(0);
             updateTableCheckboxes();
-            updateVisibleTables();
+            scheduleVisibleUpdate();
         }}
         
         function updateTableCheckboxes() {{
-            allNodesData.forEach(node => {{
-                const checkbox = document.getElementById('table-' + node.id.replace(/[^a-zA-Z0-9]/g, '_'));
-                if (checkbox) {{
-                    checkbox.checked = visibleTables.has(node.id);
-                }}
+            checkboxByNode.forEach((checkbox, id) => {{
+                checkbox.checked = isTableVisible(id);
             }});
         }}
         
+        // Filter changes are applied in the next frame: positions are read first, then the datasets and
+        // counters are written, and the fit (which measures the layout) runs in the frame after that
+        let visibleUpdateFrame = 0;
         function updateVisibleTables() {{
+            if (!nodes || !edges || visibleUpdateFrame) return;
+            visibleUpdateFrame = requestAnimationFrame(() => {{
+                visibleUpdateFrame = 0;
+                applyVisibleTables();
+            }});
+        }}
+        
+        function applyVisibleTables() {{
             if (!nodes || !edges) return;
             
-            // Filter nodes
-            const visibleNodes = allNodesData.filter(n => visibleTables.has(n.id));
+            // Leaving the group overview swaps the whole dataset; otherwise only the difference is applied
+            const rebuild = aggregatedView || !shownBits;
+            aggregatedView = false;
             
-            // Filter edges (only show if both tables are visible)
-            const visibleEdges = allEdgesData.filter(e => 
-                visibleTables.has(e.from) && visibleTables.has(e.to)
-            );
+            // Re-added tables keep their last known position (physics is off after the initial layout)
+            const known = network
+                ? Object.assign({{}}, positionsCache[currentModelName], network.getPositions())
+                : {{}};
+            
+            // One pass over the nodes: count visible tables and collect the ones that appear or disappear
+            const nodesToAdd = addedNodesArr;
+            nodesToAdd.length = 0;
+            const nodesToRemove = [];
+            const changedTables = [];
+            let tableCount = 0;
+            let factCount = 0;
+            let unplaced = false;
+            for (const n of allNodesData) {{
+                const visible = visibleBits[n.index];
+                if (visible) {{
+                    tableCount++;
+                    if (n.is_fact) factCount++;
+                }}
+                const wasShown = rebuild ? 0 : shownBits[n.index];
+                if (visible === wasShown) continue;
+                changedTables.push(n.id);
+                if (!visible) {{
+                    nodesToRemove.push(n.id);
+                }} else if (known[n.id]) {{
+                    nodesToAdd.push(Object.assign({{}}, n, known[n.id]));
+                }} else {{
+                    unplaced = true;
+                    nodesToAdd.push(n);
+                }}
+            }}
+            
+            // Edges are only shown if both tables are visible; only edges touching a changed table can flip
+            const edgesToAdd = addedEdgesArr;
+            edgesToAdd.length = 0;
+            const edgesToRemove = [];
+            const checkEdge = i => {{
+                const visible = visibleBits[edgeFrom[i]] & visibleBits[edgeTo[i]];
+                const wasShown = rebuild ? 0 : shownBits[edgeFrom[i]] & shownBits[edgeTo[i]];
+                if (visible === wasShown) return;
+                if (visible) {{
+                    edgesToAdd.push(allEdgesData[i]);
+                }} else {{
+                    edgesToRemove.push(i);
+                }}
+            }};
+            if (rebuild) {{
+                for (let i = 0; i < edgeFrom.length; i++) checkEdge(i);
+            }} else {{
+                const checked = new Set();
+                for (const id of changedTables) {{
+                    for (const i of adjByNode.get(id)) {{
+                        if (checked.has(i)) continue;
+                        checked.add(i);
+                        checkEdge(i);
+                    }}
+                }}
+            }}
             
-            // Clear and update datasets
+            let relationshipCount = 0;
             try {{
-                nodes.clear();
-                edges.clear();
+                if (rebuild) {{
+                    nodes.clear();
+                    edges.clear();
+                }} else {{
+                    if (edgesToRemove.length > 0) edges.remove(edgesToRemove);
+                    if (nodesToRemove.length > 0) nodes.remove(nodesToRemove);
+                }}
                 
-                if (visibleNodes.length > 0) {{
-                    nodes.add(visibleNodes);
+                if (nodesToAdd.length > 0) {{
+                    nodes.add(nodesToAdd);
                 }}
-                if (visibleEdges.length > 0) {{
-                    edges.add(visibleEdges);
+                if (edgesToAdd.length > 0) {{
+                    edges.add(edgesToAdd);
                 }}
+                shownBits = visibleBits.slice();
+                relationshipCount = edges.length;
                 
-                // Fit the network to show all visible nodes
-                if (network && visibleNodes.length > 0) {{
-                    network.fit({{
-                        animation: {{
-                            duration: 500,
-                            easingFunction: 'easeInOutQuad'
-                        }}
-                    }});
+                // Tables that were never laid out (e.g. expanded from the group overview) need a short physics pass
+                if (network && unplaced) {{
+                    const net = network;
+                    net.setOptions({{ physics: {{ enabled: true }} }});
+                    net.once('stabilizationIterationsDone', () => net.setOptions({{ physics: {{ enabled: false }} }}));
+                    net.stabilize(50);
                 }}
+                
             }} catch (e) {{
                 console.error('Error updating visible tables:', e);
             }}
             
             // Update stats
-            const factCount = visibleNodes.filter(n => n.shape === 'box').length;
-            document.getElementById('stat-tables').textContent = visibleNodes.length;
-            document.getElementById('stat-relationships').textContent = visibleEdges.length;
-            document.getElementById('stat-facts').textContent = factCount;
-            document.getElementById('stat-dimensions').textContent = visibleNodes.length - factCount;
+            statEls.tables.textContent = tableCount;
+            statEls.relationships.textContent = relationshipCount;
+            statEls.facts.textContent = factCount;
+            statEls.dimensions.textContent = tableCount - factCount;
             
-            // Reset selection if selected node is no longer visible
-            if (selectedNode && !visibleTables.has(selectedNode)) {{
-                selectedNode = null;
-                closeInfoPanel();
+            // Tables kept in the dataset keep their styling, so re-apply or clear the highlight
+            if (selectedNode) {{
+                if (isTableVisible(selectedNode)) {{
+                    selectNode(selectedNode);
+                }} else {{
+                    resetHighlight();
+                }}
+            }}
+            
+            // Fit the network to show all visible nodes; animating a large graph only queues redraws
+            const net = network;
+            if (net && tableCount > 0) {{
+                requestAnimationFrame(() => {{
+                    if (net !== network) return;
+                    if (tableCount >= ANIMATED_FIT_MAX_NODES) {{
+                        net.fit();
+                    }} else {{
+                        net.fit({{
+                            animation: {{
+                                duration: 500,
+                                easingFunction: 'easeInOutQuad'
+                            }}
+                        }});
+                    }}
+                }});
             }}
         }}
     </script>
 </body>
 </html>"""
     
+    html_content = _minify_html(html_content)
+    
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
@@ -1002,6 +1530,41 @@ def create_multi_model_html(models_data, output_path):
         raise
 
 
+def _scan_subdirs(path: str) -> list:
+    """List the immediate subdirectories of path (symlinks are not followed)"""
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirs
+
+
+def _find_semantic_models(root: Path, max_workers: int = 16) -> list:
+    """Find all *.SemanticModel folders under root, scanning directories concurrently
+    
+    Every directory listing is its own task, so on network shares the
+    server round-trips overlap instead of running one after another.
+    """
+    found = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_scan_subdirs, str(root))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for subdir in future.result():
+                    if subdir.endswith('.SemanticModel'):
+                        found.append(Path(subdir))
+                    pending.add(pool.submit(_scan_subdirs, subdir))
+    return sorted(found)
+
+
 def find_relationship_files(search_path: Path) -> list:
     """Recursively find all relationships.tmdl files under search_path"""
     print(f"🔍 Scanning for semantic models in: {search_path}")
@@ -1010,7 +1573,11 @@ def find_relationship_files(search_path: Path) -> list:
         print(f"❌ Error: Search path does not exist: {search_path}")
         return []
     
-    relationship_files = list(search_path.glob("**/*.SemanticModel/definition/relationships.tmdl"))
+    relationship_files = [
+        model / 'definition' / 'relationships.tmdl'
+        for model in _find_semantic_models(search_path)
+        if (model / 'definition' / 'relationships.tmdl').is_file()
+    ]
     
     if not relationship_files:
         print(f"⚠️  No semantic models found with relationships.tmdl files")
@@ -1028,6 +1595,7 @@ Examples:
   %(prog)s
   %(prog)s --search-path ./my_models
   %(prog)s --no-browser
+  %(prog)s --renderer sigma
         """
     )
     
@@ -1044,6 +1612,13 @@ Examples:
         help='Skip automatically opening the HTML file in browser'
     )
     
+    parser.add_argument(
+        '--renderer',
+        choices=sorted(_RENDERER_SCRIPTS),
+        default='visjs',
+        help='Graph renderer: visjs (canvas, default) or sigma (WebGL, for models with thousands of tables)'
+    )
+    
     args = parser.parse_args()
     
     # Find all relationships.tmdl files
@@ -1059,26 +1634,30 @@ Examples:
     
     models_data = {}
     
-    for rel_file in relationship_files:
-        # Extract model name
-        model_name = rel_file.parts[-3].replace('.SemanticModel', '')
-        
-        print(f"  Processing: {model_name}")
+    # Parse every file concurrently; results are consumed in discovery order
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(relationship_files))) as pool:
+        futures = [pool.submit(parse_tmdl_relationships, rel_file) for rel_file in relationship_files]
         
-        try:
-            relationships = parse_tmdl_relationships(rel_file)
+        for rel_file, future in zip(relationship_files, futures):
+            # Extract model name
+            model_name = rel_file.parts[-3].replace('.SemanticModel', '')
             
-            if relationships:
-                model_data = prepare_model_data(relationships, model_name)
-                models_data[model_name] = {
-                    'data': model_data,
-                    'stats': model_data['stats']
-                }
-                print(f"    ✓ {model_data['stats']['relationships']} relationships, {model_data['stats']['tables']} tables")
-            else:
-                print(f"    ⚠ No relationships found")
-        except Exception as e:
-            print(f"    ✗ Error: {e}")
+            print(f"  Processing: {model_name}")
+            
+            try:
+                relationships = future.result()
+                
+                if relationships:
+                    model_data = prepare_model_data(relationships, model_name)
+                    models_data[model_name] = {
+                        'data': model_data,
+                        'stats': model_data['stats']
+                    }
+                    print(f"    ✓ {model_data['stats']['relationships']} relationships, {model_data['stats']['tables']} tables")
+                else:
+                    print(f"    ⚠ No relationships found")
+            except Exception as e:
+                print(f"    ✗ Error: {e}")
     
     if not models_data:
         print("\n⚠️  No models with relationships found.")
@@ -1088,7 +1667,7 @@ Examples:
     output_path = Path.cwd() / "relationships_viewer.html"
     
     print(f"\n🎨 Creating multi-model viewer...")
-    create_multi_model_html(models_data, output_path)
+    create_multi_model_html(models_data, output_path, renderer=args.renderer)
     
     print(f"\n✅ Done! Visualization saved to: {output_path}")
     print(f"   Models available: {len(models_data)}")
@@ -13,661 +13,547 @@ How to run:
   Using VS Code with Copilot? Just ask:
        "Run the visualize_bpa_results.py script on my TRX files"
 
-Requirements: Python 3.7+ (no external dependencies)
+Requirements: Python 3.7+ (no external dependencies; uses lxml and orjson for faster parsing and output if installed)
 """
+import os
 import sys
 import argparse
+import base64
+import functools
+import gzip
+import html
 import re
 import json
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import webbrowser
-import xml.etree.ElementTree as ET
 from datetime import datetime
 
+try:
+    from lxml import etree as ET
+    # libxml2 refuses very deep/large text nodes unless huge_tree is set; IDs are never looked up
+    _ITERPARSE_OPTIONS = {'huge_tree': True, 'collect_ids': False}
+except ImportError:  # Optional: C-backed parsing of large TRX files
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_OPTIONS = {}
 
-def parse_trx_file(file_path):
-    """Parse TRX file and extract test run metadata and results"""
-    try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        # Define namespace
-        ns = {'ns': 'http://microsoft.com/schemas/VisualStudio/TeamTest/2010'}
-        
-        # Extract test run info
-        test_run = root.find('.//ns:TestRun', ns)
-        run_name = test_run.get('name', '') if test_run else ''
-        
-        # Extract model name from run name or filename
-        model_name = ''
-        if run_name:
-            # Extract from path like "C:\...\D&A - Inventory Insights.SemanticModel\definition"
-            match = re.search(r'([^\\]+)\.SemanticModel', run_name)
-            if match:
-                model_name = match.group(1)
-        
-        if not model_name:
-            # Fallback to filename pattern: 20251114_1705_BPA_Inventory_Insights.trx
-            filename = Path(file_path).stem
-            parts = filename.split('_BPA_')
-            if len(parts) == 2:
-                model_name = parts[1].replace('_', ' ')
-        
-        # Extract timestamps
-        times = root.find('.//ns:Times', ns)
-        start_time = times.get('start', '') if times is not None else ''
-        finish_time = times.get('finish', '') if times is not None else ''
-        
-        # Extract result summary
-        result_summary = root.find('.//ns:ResultSummary', ns)
-        outcome = result_summary.get('outcome', 'Unknown') if result_summary is not None else 'Unknown'
-        
-        counters = root.find('.//ns:Counters', ns)
-        stats = {
-            'total': int(counters.get('total', 0)) if counters is not None else 0,
-            'executed': int(counters.get('executed', 0)) if counters is not None else 0,
-            'passed': int(counters.get('passed', 0)) if counters is not None else 0,
-            'failed': int(counters.get('failed', 0)) if counters is not None else 0,
-            'inconclusive': int(counters.get('inconclusive', 0)) if counters is not None else 0,
-            'notExecuted': int(counters.get('notExecuted', 0)) if counters is not None else 0,
-        }
-        
-        # Calculate pass rate
-        pass_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-        
-        # Extract test definitions (rules)
-        rules = {}
-        for unit_test in root.findall('.//ns:UnitTest', ns):
-            test_id = unit_test.get('id', '')
-            test_name = unit_test.get('name', '')
-            
-            properties = {}
-            for prop in unit_test.findall('.//ns:Property', ns):
-                key_elem = prop.find('ns:Key', ns)
-                value_elem = prop.find('ns:Value', ns)
-                if key_elem is not None and value_elem is not None:
-                    properties[key_elem.text] = value_elem.text
-            
-            rules[test_id] = {
-                'id': test_id,
-                'name': test_name,
-                'description': properties.get('Description', ''),
-                'severity': int(properties.get('Severity', 1)),
-                'category': properties.get('Category', 'Unknown'),
-                'rule_id': properties.get('RuleID', ''),
-            }
-        
-        # Extract test results (violations)
-        violations_by_rule = defaultdict(list)
-        
-        for result in root.findall('.//ns:UnitTestResult', ns):
-            test_id = result.get('testId', '')
-            outcome = result.get('outcome', '')
-            
-            if outcome == 'Failed':
-                # Extract error message and stack trace (violation details)
-                output = result.find('.//ns:Output', ns)
-                if output is not None:
-                    error_info = output.find('.//ns:ErrorInfo', ns)
-                    if error_info is not None:
-                        message_elem = error_info.find('ns:Message', ns)
-                        stack_trace_elem = error_info.find('ns:StackTrace', ns)
-                        
-                        violation_count = ''
-                        if message_elem is not None and message_elem.text:
-                            violation_count = message_elem.text.strip()
-                        
-                        # Parse StackTrace to get individual violated objects
-                        if stack_trace_elem is not None and stack_trace_elem.text:
-                            stack_trace = stack_trace_elem.text.strip()
-                            # Parse "Objects in violation:\n  Object1\n  Object2\n..."
-                            if 'Objects in violation:' in stack_trace:
-                                objects_text = stack_trace.split('Objects in violation:')[1].strip()
-                                object_lines = [line.strip() for line in objects_text.split('\n') if line.strip()]
-                                
-                                for obj_line in object_lines:
-                                    violations_by_rule[test_id].append({
-                                        'object': obj_line,
-                                        'message': violation_count
-                                    })
-        
-        return {
-            'model_name': model_name,
-            'file_name': Path(file_path).name,
-            'start_time': start_time,
-            'finish_time': finish_time,
-            'outcome': outcome,
-            'stats': stats,
-            'pass_rate': pass_rate,
-            'rules': rules,
-            'violations': violations_by_rule
-        }
-        
-    except Exception as e:
-        print(f"    ✗ Error parsing {Path(file_path).name}: {e}")
-        return None
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, default=_slots_to_dict).decode('utf-8')
+except ImportError:  # Optional: faster serialization of the embedded results
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), default=_slots_to_dict)
 
+# TRX element tags in Clark notation, so lookups need no prefix map
+_NS = '{http://microsoft.com/schemas/VisualStudio/TeamTest/2010}'
+_Q_TEST_RUN = _NS + 'TestRun'
+_Q_TIMES = _NS + 'Times'
+_Q_RESULT_SUMMARY = _NS + 'ResultSummary'
+_Q_COUNTERS = _NS + 'Counters'
+_Q_UNIT_TEST = _NS + 'UnitTest'
+_Q_PROPERTY = _NS + 'Property'
+_Q_UNIT_TEST_RESULT = _NS + 'UnitTestResult'
+_Q_OUTPUT = _NS + 'Output'
+_Q_ERROR_INFO = _NS + 'ErrorInfo'
+_Q_MESSAGE = _NS + 'Message'
+_Q_STACK_TRACE = _NS + 'StackTrace'
 
-def extract_object_name(violation_msg):
-    """Extract object name from violation message"""
-    # Try to extract object name from common patterns
-    # Pattern 1: "Object: TableName.ColumnName"
-    match = re.search(r'Object:\s*(.+?)(?:\s+-|\s*$)', violation_msg)
-    if match:
-        return match.group(1).strip()
-    
-    # Pattern 2: Look for table[column] pattern
-    match = re.search(r"'([^']+)'\['([^']+)'\]", violation_msg)
-    if match:
-        return f"{match.group(1)}.{match.group(2)}"
-    
-    # Pattern 3: Look for table.column pattern
-    match = re.search(r'(\w+)\.(\w+)', violation_msg)
-    if match:
-        return f"{match.group(1)}.{match.group(2)}"
-    
-    # Return first 50 chars if no pattern matches
-    return violation_msg[:50] + '...' if len(violation_msg) > 50 else violation_msg
+# '<Model>.SemanticModel' segment of a TestRun name (the analysed model folder path)
+_MODEL_RE = re.compile(r'([^\\]+)\.SemanticModel')
+# StackTrace marker that precedes the list of violated objects
+_OBJECTS_IN_VIOLATION = 'Objects in violation:'
 
+# Violation-message patterns, compiled once rather than per violation
+_OBJECT_RE = re.compile(r'Object:\s*(.+?)(?:\s+-|\s*$)')
+_QUOTED_COLUMN_RE = re.compile(r"'([^']+)'\['([^']+)'\]")
+_DOTTED_NAME_RE = re.compile(r'(\w+)\.(\w+)')
 
-def prepare_visualization_data(trx_data):
-    """Prepare data structure for visualization"""
-    rules = trx_data['rules']
-    violations = trx_data['violations']
-    
-    # Group rules by category
-    rules_by_category = defaultdict(list)
-    for rule_id, rule in rules.items():
-        category = rule['category']
-        
-        # Get violations for this rule
-        rule_violations = violations.get(rule_id, [])
-        
-        rule_data = {
-            'id': rule_id,
-            'name': rule['name'],
-            'description': rule['description'],
-            'severity': rule['severity'],
-            'rule_id': rule['rule_id'],
-            'status': 'failed' if rule_violations else 'passed',
-            'violation_count': len(rule_violations),
-            'violations': rule_violations
-        }
-        
-        rules_by_category[category].append(rule_data)
-    
-    # Calculate category statistics
-    category_stats = {}
-    for category, category_rules in rules_by_category.items():
-        total = len(category_rules)
-        passed = sum(1 for r in category_rules if r['status'] == 'passed')
-        failed = total - passed
-        pass_rate = (passed / total * 100) if total > 0 else 0
-        
-        category_stats[category] = {
-            'total': total,
-            'passed': passed,
-            'failed': failed,
-            'pass_rate': pass_rate,
-            'rules': category_rules
-        }
-    
-    return {
-        'categories': category_stats,
-        'stats': trx_data['stats'],
-        'pass_rate': trx_data['pass_rate']
-    }
+# Viewer stylesheet (minified into the page by _minify_css)
+_CSS = """
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    margin: 0;
+    padding: 0;
+    background-color: #f5f5f5;
+}
+#header {
+    background-color: #2C3E50;
+    color: white;
+    padding: 15px 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+#header h1 {
+    margin: 0;
+    font-size: 24px;
+}
+#model-selector {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+#model-selector label {
+    font-size: 14px;
+    font-weight: bold;
+}
+#model-selector select {
+    padding: 8px 12px;
+    font-size: 14px;
+    border: none;
+    border-radius: 4px;
+    background-color: white;
+    color: #2C3E50;
+    cursor: pointer;
+    min-width: 400px;
+}
+#stats {
+    background-color: #34495E;
+    color: white;
+    padding: 12px 20px;
+    display: flex;
+    justify-content: center;
+    gap: 40px;
+    font-size: 13px;
+}
+.stat-item {
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+.stat-item strong {
+    font-size: 18px;
+}
+.pass-rate {
+    font-size: 20px;
+    font-weight: bold;
+}
+.pass-rate.good { color: #27AE60; }
+.pass-rate.warning { color: #F39C12; }
+.pass-rate.bad { color: #E74C3C; }
 
+.instructions {
+    background-color: #FFF3CD;
+    border: 1px solid #FFE69C;
+    border-radius: 8px;
+    padding: 10px 20px;
+    margin: 10px 20px;
+    color: #856404;
+    font-size: 13px;
+}
+.instructions strong {
+    display: inline;
+    margin-right: 8px;
+    font-size: 14px;
+}
 
-def create_multi_model_html(models_data, output_path):
-    """Create an interactive HTML with dropdown to select BPA results"""
-    
-    # Create JavaScript object with all models data
-    models_json = json.dumps(models_data)
-    
-    html_content = f"""<!DOCTYPE html>
+#content {
+    padding: 20px;
+    max-width: 1400px;
+    margin: 0 auto;
+}
+
+/* Failed Only filter: hide passed rules and categories without a failure */
+#content.show-failed .rule-item[data-status="passed"],
+#content.show-failed .category-section:not(.has-failures) {
+    display: none;
+}
+
+.render-progress {
+    margin: 0 20px 10px;
+    font-size: 13px;
+    color: #666;
+}
+
+.render-progress:empty {
+    display: none;
+}
+
+.category-section {
+    background: white;
+    border-radius: 8px;
+    margin-bottom: 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+
+.category-header {
+    background-color: #3498DB;
+    color: white;
+    padding: 15px 20px;
+    cursor: pointer;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    user-select: none;
+}
+
+.category-header:hover {
+    background-color: #2980B9;
+}
+
+.category-header.failed {
+    background-color: #E74C3C;
+}
+
+.category-header.failed:hover {
+    background-color: #C0392B;
+}
+
+.category-title {
+    display: flex;
+    align-items: center;
+    gap: 12px;
+    font-size: 16px;
+    font-weight: bold;
+}
+
+.category-stats {
+    display: flex;
+    gap: 20px;
+    font-size: 14px;
+}
+
+.category-content {
+    display: none;
+    padding: 20px;
+}
+
+.category-content.expanded {
+    display: block;
+}
+
+.rule-item {
+    border-left: 4px solid #3498DB;
+    background-color: #f8f9fa;
+    padding: 15px;
+    margin-bottom: 12px;
+    border-radius: 4px;
+}
+
+.rule-item.failed {
+    border-left-color: #E74C3C;
+    background-color: #FADBD8;
+}
+
+.rule-item.passed {
+    border-left-color: #27AE60;
+    background-color: #D5F4E6;
+}
+
+.rule-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: flex-start;
+    margin-bottom: 8px;
+    cursor: pointer;
+    user-select: none;
+}
+
+.rule-header:hover {
+    opacity: 0.8;
+}
+
+.rule-name {
+    font-weight: bold;
+    color: #2C3E50;
+    font-size: 14px;
+    flex: 1;
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+
+.rule-expand-icon {
+    font-size: 12px;
+    transition: transform 0.3s;
+    color: #666;
+}
+
+.rule-expand-icon.expanded {
+    transform: rotate(180deg);
+}
+
+.rule-status {
+    padding: 4px 12px;
+    border-radius: 12px;
+    font-size: 12px;
+    font-weight: bold;
+    text-transform: uppercase;
+}
+
+.rule-status.passed {
+    background-color: #27AE60;
+    color: white;
+}
+
+.rule-status.failed {
+    background-color: #E74C3C;
+    color: white;
+}
+
+.rule-description {
+    color: #666;
+    font-size: 13px;
+    line-height: 1.5;
+    margin-top: 8px;
+    padding: 10px;
+    background-color: white;
+    border-radius: 4px;
+    display: none;
+}
+
+.rule-description.expanded {
+    display: block;
+}
+
+.violations-section {
+    margin-top: 12px;
+    padding: 10px;
+    background-color: white;
+    border-radius: 4px;
+    display: none;
+}
+
+.violations-section.expanded {
+    display: block;
+}
+
+.violations-header {
+    font-weight: bold;
+    color: #E74C3C;
+    margin-bottom: 8px;
+    font-size: 13px;
+    cursor: pointer;
+    user-select: none;
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+
+.violations-header:hover {
+    opacity: 0.8;
+}
+
+.violations-expand-icon {
+    font-size: 12px;
+    transition: transform 0.3s;
+}
+
+.violations-expand-icon.expanded {
+    transform: rotate(180deg);
+}
+
+.violations-list {
+    display: none;
+}
+
+.violations-list.expanded {
+    display: block;
+}
+
+.violation-item {
+    padding: 8px 12px;
+    margin: 6px 0;
+    background-color: #FFF5F5;
+    border-left: 3px solid #E74C3C;
+    border-radius: 3px;
+    font-size: 12px;
+    font-family: 'Consolas', 'Monaco', monospace;
+}
+
+.violation-object {
+    color: #8E44AD;
+    font-weight: bold;
+}
+
+.violation-message {
+    color: #555;
+    margin-top: 4px;
+}
+
+.severity-badge {
+    display: inline-block;
+    padding: 2px 8px;
+    border-radius: 10px;
+    font-size: 11px;
+    font-weight: bold;
+    margin-left: 8px;
+}
+
+.severity-1 {
+    background-color: #F1C40F;
+    color: #2C3E50;
+}
+
+.severity-2 {
+    background-color: #F39C12;
+    color: white;
+}
+
+.severity-3 {
+    background-color: #E74C3C;
+    color: white;
+}
+
+.expand-icon {
+    transition: transform 0.3s;
+}
+
+.expand-icon.expanded {
+    transform: rotate(180deg);
+}
+
+.legend {
+    background-color: white;
+    border: 1px solid #ddd;
+    border-radius: 8px;
+    padding: 10px 20px;
+    margin: 10px 20px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    display: flex;
+    align-items: center;
+    gap: 25px;
+    flex-wrap: wrap;
+}
+
+.legend h3 {
+    margin: 0;
+    color: #2C3E50;
+    font-size: 16px;
+}
+
+.legend-item {
+    display: flex;
+    align-items: center;
+    font-size: 13px;
+}
+
+.legend-color {
+    width: 20px;
+    height: 20px;
+    margin-right: 8px;
+    border-radius: 3px;
+}
+
+.legend-color.passed {
+    background-color: #27AE60;
+}
+
+.legend-color.failed {
+    background-color: #E74C3C;
+}
+
+.legend-color.severity-1 {
+    background-color: #F1C40F;
+}
+
+.legend-color.severity-2 {
+    background-color: #F39C12;
+}
+
+.legend-color.severity-3 {
+    background-color: #E74C3C;
+}
+
+.filter-controls {
+    background: white;
+    padding: 15px 20px;
+    margin: 10px 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    display: flex;
+    gap: 15px;
+    align-items: center;
+}
+
+.filter-controls label {
+    font-weight: bold;
+    color: #2C3E50;
+}
+
+.filter-controls button {
+    padding: 8px 16px;
+    border: 1px solid #ddd;
+    border-radius: 4px;
+    background-color: #f8f9fa;
+    cursor: pointer;
+    font-size: 13px;
+}
+
+.filter-controls button:hover {
+    background-color: #e9ecef;
+}
+
+.filter-controls button.active {
+    background-color: #3498DB;
+    color: white;
+    border-color: #3498DB;
+}
+
+#version-toggle {
+    padding: 8px 16px;
+    font-size: 13px;
+    border: 2px solid white;
+    border-radius: 4px;
+    background-color: transparent;
+    color: white;
+    cursor: pointer;
+    font-weight: bold;
+    transition: all 0.3s;
+}
+
+#version-toggle:hover {
+    background-color: rgba(255, 255, 255, 0.1);
+}
+
+#version-toggle.active {
+    background-color: white;
+    color: #2C3E50;
+}
+
+.timestamp-info {
+    background: white;
+    padding: 10px 20px;
+    margin: 10px 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    font-size: 13px;
+    color: #666;
+}
+"""
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};:,])\s*')
+_LINE_INDENT_RE = re.compile(r'\s*\n\s*')
+
+
+def _minify_css(css):
+    """Strip comments and collapse whitespace in a stylesheet"""
+    css = _CSS_SPACE_RE.sub(' ', _CSS_COMMENT_RE.sub('', css))
+    return _CSS_PUNCT_RE.sub(r'\1', css).strip()
+
+
+def _minify_html(text):
+    """Drop indentation and blank lines; line breaks are kept so // comments in inline JS stay safe"""
+    return _LINE_INDENT_RE.sub('\n', text).strip()
+
+
+# Static page around the per-run data. Nothing in it is formatted, so the markup
+# and script are written as is (minified once at import).
+_HTML_HEAD = _minify_html(r"""<!DOCTYPE html>
 <html>
 <head>
+    <meta charset="utf-8">
     <title>Power BI Semantic Models - BPA Results Viewer</title>
     <style type="text/css">
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 0;
-            background-color: #f5f5f5;
-        }}
-        #header {{
-            background-color: #2C3E50;
-            color: white;
-            padding: 15px 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        #header h1 {{
-            margin: 0;
-            font-size: 24px;
-        }}
-        #model-selector {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        #model-selector label {{
-            font-size: 14px;
-            font-weight: bold;
-        }}
-        #model-selector select {{
-            padding: 8px 12px;
-            font-size: 14px;
-            border: none;
-            border-radius: 4px;
-            background-color: white;
-            color: #2C3E50;
-            cursor: pointer;
-            min-width: 400px;
-        }}
-        #stats {{
-            background-color: #34495E;
-            color: white;
-            padding: 12px 20px;
-            display: flex;
-            justify-content: center;
-            gap: 40px;
-            font-size: 13px;
-        }}
-        .stat-item {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        .stat-item strong {{
-            font-size: 18px;
-        }}
-        .pass-rate {{
-            font-size: 20px;
-            font-weight: bold;
-        }}
-        .pass-rate.good {{ color: #27AE60; }}
-        .pass-rate.warning {{ color: #F39C12; }}
-        .pass-rate.bad {{ color: #E74C3C; }}
-        
-        .instructions {{
-            background-color: #FFF3CD;
-            border: 1px solid #FFE69C;
-            border-radius: 8px;
-            padding: 10px 20px;
-            margin: 10px 20px;
-            color: #856404;
-            font-size: 13px;
-        }}
-        .instructions strong {{
-            display: inline;
-            margin-right: 8px;
-            font-size: 14px;
-        }}
-        
-        #content {{
-            padding: 20px;
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-        
-        .category-section {{
-            background: white;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .category-header {{
-            background-color: #3498DB;
-            color: white;
-            padding: 15px 20px;
-            cursor: pointer;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            user-select: none;
-        }}
-        
-        .category-header:hover {{
-            background-color: #2980B9;
-        }}
-        
-        .category-header.failed {{
-            background-color: #E74C3C;
-        }}
-        
-        .category-header.failed:hover {{
-            background-color: #C0392B;
-        }}
-        
-        .category-title {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            font-size: 16px;
-            font-weight: bold;
-        }}
-        
-        .category-stats {{
-            display: flex;
-            gap: 20px;
-            font-size: 14px;
-        }}
-        
-        .category-content {{
-            display: none;
-            padding: 20px;
-        }}
-        
-        .category-content.expanded {{
-            display: block;
-        }}
-        
-        .rule-item {{
-            border-left: 4px solid #3498DB;
-            background-color: #f8f9fa;
-            padding: 15px;
-            margin-bottom: 12px;
-            border-radius: 4px;
-        }}
-        
-        .rule-item.failed {{
-            border-left-color: #E74C3C;
-            background-color: #FADBD8;
-        }}
-        
-        .rule-item.passed {{
-            border-left-color: #27AE60;
-            background-color: #D5F4E6;
-        }}
-        
-        .rule-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            margin-bottom: 8px;
-            cursor: pointer;
-            user-select: none;
-        }}
-        
-        .rule-header:hover {{
-            opacity: 0.8;
-        }}
-        
-        .rule-name {{
-            font-weight: bold;
-            color: #2C3E50;
-            font-size: 14px;
-            flex: 1;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .rule-expand-icon {{
-            font-size: 12px;
-            transition: transform 0.3s;
-            color: #666;
-        }}
-        
-        .rule-expand-icon.expanded {{
-            transform: rotate(180deg);
-        }}
-        
-        .rule-status {{
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: bold;
-            text-transform: uppercase;
-        }}
-        
-        .rule-status.passed {{
-            background-color: #27AE60;
-            color: white;
-        }}
-        
-        .rule-status.failed {{
-            background-color: #E74C3C;
-            color: white;
-        }}
-        
-        .rule-description {{
-            color: #666;
-            font-size: 13px;
-            line-height: 1.5;
-            margin-top: 8px;
-            padding: 10px;
-            background-color: white;
-            border-radius: 4px;
-            display: none;
-        }}
-        
-        .rule-description.expanded {{
-            display: block;
-        }}
-        
-        .violations-section {{
-            margin-top: 12px;
-            padding: 10px;
-            background-color: white;
-            border-radius: 4px;
-            display: none;
-        }}
-        
-        .violations-section.expanded {{
-            display: block;
-        }}
-        
-        .violations-header {{
-            font-weight: bold;
-            color: #E74C3C;
-            margin-bottom: 8px;
-            font-size: 13px;
-            cursor: pointer;
-            user-select: none;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .violations-header:hover {{
-            opacity: 0.8;
-        }}
-        
-        .violations-expand-icon {{
-            font-size: 12px;
-            transition: transform 0.3s;
-        }}
-        
-        .violations-expand-icon.expanded {{
-            transform: rotate(180deg);
-        }}
-        
-        .violations-list {{
-            display: none;
-        }}
-        
-        .violations-list.expanded {{
-            display: block;
-        }}
-        
-        .violation-item {{
-            padding: 8px 12px;
-            margin: 6px 0;
-            background-color: #FFF5F5;
-            border-left: 3px solid #E74C3C;
-            border-radius: 3px;
-            font-size: 12px;
-            font-family: 'Consolas', 'Monaco', monospace;
-        }}
-        
-        .violation-object {{
-            color: #8E44AD;
-            font-weight: bold;
-        }}
-        
-        .violation-message {{
-            color: #555;
-            margin-top: 4px;
-        }}
-        
-        .severity-badge {{
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 11px;
-            font-weight: bold;
-            margin-left: 8px;
-        }}
-        
-        .severity-1 {{
-            background-color: #F1C40F;
-            color: #2C3E50;
-        }}
-        
-        .severity-2 {{
-            background-color: #F39C12;
-            color: white;
-        }}
-        
-        .severity-3 {{
-            background-color: #E74C3C;
-            color: white;
-        }}
-        
-        .expand-icon {{
-            transition: transform 0.3s;
-        }}
-        
-        .expand-icon.expanded {{
-            transform: rotate(180deg);
-        }}
-        
-        .legend {{
-            background-color: white;
-            border: 1px solid #ddd;
-            border-radius: 8px;
-            padding: 10px 20px;
-            margin: 10px 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            display: flex;
-            align-items: center;
-            gap: 25px;
-            flex-wrap: wrap;
-        }}
-        
-        .legend h3 {{
-            margin: 0;
-            color: #2C3E50;
-            font-size: 16px;
-        }}
-        
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            font-size: 13px;
-        }}
-        
-        .legend-color {{
-            width: 20px;
-            height: 20px;
-            margin-right: 8px;
-            border-radius: 3px;
-        }}
-        
-        .legend-color.passed {{
-            background-color: #27AE60;
-        }}
-        
-        .legend-color.failed {{
-            background-color: #E74C3C;
-        }}
-        
-        .legend-color.severity-1 {{
-            background-color: #F1C40F;
-        }}
-        
-        .legend-color.severity-2 {{
-            background-color: #F39C12;
-        }}
-        
-        .legend-color.severity-3 {{
-            background-color: #E74C3C;
-        }}
-        
-        .filter-controls {{
-            background: white;
-            padding: 15px 20px;
-            margin: 10px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            display: flex;
-            gap: 15px;
-            align-items: center;
-        }}
-        
-        .filter-controls label {{
-            font-weight: bold;
-            color: #2C3E50;
-        }}
-        
-        .filter-controls button {{
-            padding: 8px 16px;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            background-color: #f8f9fa;
-            cursor: pointer;
-            font-size: 13px;
-        }}
-        
-        .filter-controls button:hover {{
-            background-color: #e9ecef;
-        }}
-        
-        .filter-controls button.active {{
-            background-color: #3498DB;
-            color: white;
-            border-color: #3498DB;
-        }}
-        
-        #version-toggle {{
-            padding: 8px 16px;
-            font-size: 13px;
-            border: 2px solid white;
-            border-radius: 4px;
-            background-color: transparent;
-            color: white;
-            cursor: pointer;
-            font-weight: bold;
-            transition: all 0.3s;
-        }}
-        
-        #version-toggle:hover {{
-            background-color: rgba(255, 255, 255, 0.1);
-        }}
-        
-        #version-toggle.active {{
-            background-color: white;
-            color: #2C3E50;
-        }}
-        
-        .timestamp-info {{
-            background: white;
-            padding: 10px 20px;
-            margin: 10px 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            font-size: 13px;
-            color: #666;
-        }}
-    </style>
+""")
+
+_HTML_BODY = _minify_html(r"""    </style>
 </head>
 <body>
     <div id="header">
@@ -741,91 +627,131 @@ def create_multi_model_html(models_data, output_path):
     </div>
     
     <div class="timestamp-info" id="timestamp-info"></div>
+    <div class="render-progress" id="render-progress"></div>
     
-    <div id="content"></div>
+    <div id="content" class="show-all"></div>
+
+    <template id="category-template">
+        <div class="category-section">
+            <div class="category-header">
+                <div class="category-title">
+                    <span class="expand-icon">▼</span>
+                    <span class="category-name"></span>
+                </div>
+                <div class="category-stats">
+                    <span class="category-passed"></span>
+                    <span class="category-failed"></span>
+                    <span class="category-rate"></span>
+                </div>
+            </div>
+            <div class="category-content"></div>
+        </div>
+    </template>
+    <template id="rule-template">
+        <div class="rule-item">
+            <div class="rule-header">
+                <div class="rule-name">
+                    <span class="rule-expand-icon">▼</span>
+                    <span class="rule-title"></span>
+                    <span class="violation-badge" style="font-size: 12px; color: #E74C3C; font-weight: bold;"></span>
+                    <span class="severity-badge"></span>
+                </div>
+                <div class="rule-status"></div>
+            </div>
+            <div class="rule-description"></div>
+        </div>
+    </template>
+    <template id="violations-template">
+        <div class="violations-section">
+            <div class="violations-header">
+                <span class="violations-expand-icon">▼</span>
+                <span class="violations-title"></span>
+            </div>
+            <div class="violations-list"></div>
+        </div>
+    </template>
+    <template id="violation-template">
+        <div class="violation-item">
+            <div class="violation-object"></div>
+        </div>
+    </template>
+""") + '\n'
 
-    <script type="text/javascript">
-        // All models data
-        const modelsData = {models_json};
+_HTML_TAIL = _minify_html(r"""    <script type="text/javascript">
+        // Each run's results sit in a gzip-compressed data block above and are
+        // decoded the first time the run is selected
+        const runBlocks = {};
+        document.querySelectorAll('script.run-data').forEach(el => {
+            runBlocks[el.dataset.run] = el;
+        });
         let currentFilter = 'all';
         let showLatestOnly = true; // Default to latest only
         
-        // Get latest analysis per model
-        function getLatestAnalyses() {{
-            const modelMap = new Map();
-            
-            // Group by model name and keep only the most recent
-            Object.keys(modelsData).forEach(key => {{
-                const model = modelsData[key];
-                const modelName = model.model_name;
-                
-                if (!modelMap.has(modelName) || key > modelMap.get(modelName)) {{
-                    modelMap.set(modelName, key);
-                }}
-            }});
-            
-            return Array.from(modelMap.values());
-        }}
-        
         // Populate dropdown
-        function populateDropdown() {{
+        function populateDropdown() {
             const select = document.getElementById('model-select');
             select.innerHTML = ''; // Clear existing options
             
             // Get keys based on current mode
-            let keysToShow;
-            if (showLatestOnly) {{
-                keysToShow = getLatestAnalyses();
-            }} else {{
-                keysToShow = Object.keys(modelsData);
-            }}
-            
-            // Sort by filename (most recent first)
-            keysToShow.sort().reverse();
+            const keysToShow = showLatestOnly ? LATEST_KEYS : ALL_KEYS;
             
-            keysToShow.forEach(key => {{
+            // Options are built off-document and inserted in one go
+            const fragment = document.createDocumentFragment();
+            keysToShow.forEach(key => {
                 const model = modelsData[key];
                 const option = document.createElement('option');
                 option.value = key;
                 
                 // Format: "Model Name - Pass Rate% (YYYY-MM-DD HH:MM)"
-                const passRate = model.data.pass_rate.toFixed(1);
+                const passRate = model.pass_rate.toFixed(1);
                 const timestamp = model.file_name.substring(0, 13).replace('_', ' ');
-                option.textContent = `${{model.model_name}} - ${{passRate}}% (${{timestamp}})`;
+                option.textContent = `${model.model_name} - ${passRate}% (${timestamp})`;
                 
-                select.appendChild(option);
-            }});
+                fragment.appendChild(option);
+            });
+            select.appendChild(fragment);
             
             // Load first model by default
-            if (keysToShow.length > 0) {{
+            if (keysToShow.length > 0) {
                 const firstModel = keysToShow[0];
                 select.value = firstModel;
                 loadModel(firstModel);
-            }}
-        }}
+            }
+        }
         
-        function toggleVersionMode() {{
+        function toggleVersionMode() {
             showLatestOnly = !showLatestOnly;
             const toggleBtn = document.getElementById('version-toggle');
             
-            if (showLatestOnly) {{
+            if (showLatestOnly) {
                 toggleBtn.textContent = 'Latest Only';
                 toggleBtn.classList.add('active');
-            }} else {{
+            } else {
                 toggleBtn.textContent = 'All Analyses';
                 toggleBtn.classList.remove('active');
-            }}
+            }
             
             populateDropdown();
-        }}
+        }
         
         // Initialize dropdown on load
         populateDropdown();
         
-        function loadModel(modelKey) {{
+        async function decodeRunData(blob) {
+            const bytes = Uint8Array.from(atob(blob), c => c.charCodeAt(0));
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return JSON.parse(await new Response(stream).text());
+        }
+        
+        async function loadModel(modelKey) {
             if (!modelKey || !modelsData[modelKey]) return;
             
             const model = modelsData[modelKey];
+            if (!model.data) {
+                model.data = await decodeRunData(runBlocks[modelKey].textContent);
+                // Another run may have been selected while this one was decoding
+                if (document.getElementById('model-select').value !== modelKey) return;
+            }
             const data = model.data;
             
             // Update stats
@@ -839,206 +765,256 @@ def create_multi_model_html(models_data, output_path):
             document.getElementById('stat-total').textContent = data.stats.total;
             
             // Update timestamp info
-            const timestampInfo = document.getElementById('timestamp-info');
-            timestampInfo.innerHTML = `<strong>File:</strong> ${{model.file_name}} | <strong>Model:</strong> ${{model.model_name}}`;
+            // File and model names come from the TRX input, so they are set as text
+            const label = text => {
+                const strong = document.createElement('strong');
+                strong.textContent = text;
+                return strong;
+            };
+            document.getElementById('timestamp-info').replaceChildren(
+                label('File:'), ` ${model.file_name} | `, label('Model:'), ` ${model.model_name}`
+            );
             
             // Render categories and rules
             renderCategories(data.categories);
-        }}
+        }
         
-        function getPassRateClass(passRate) {{
+        function getPassRateClass(passRate) {
             if (passRate >= 80) return 'good';
             if (passRate >= 60) return 'warning';
             return 'bad';
-        }}
+        }
+        
+        // Row skeletons from the <template> blocks; clones are filled in with textContent
+        const categoryTemplate = document.getElementById('category-template').content.firstElementChild;
+        const ruleTemplate = document.getElementById('rule-template').content.firstElementChild;
+        const violationsTemplate = document.getElementById('violations-template').content.firstElementChild;
+        const violationTemplate = document.getElementById('violation-template').content.firstElementChild;
+        
+        // One delegated listener handles every category, rule and violations header
+        document.getElementById('content').addEventListener('click', event => {
+            const header = event.target.closest('.category-header, .rule-header, .violations-header');
+            if (!header) return;
+            
+            if (header.classList.contains('category-header')) {
+                toggleCategory(header.parentElement.dataset.category);
+            } else if (header.classList.contains('rule-header')) {
+                toggleRule(header.closest('.rule-item').dataset.rule);
+            } else {
+                toggleViolationsList(header.closest('.rule-item').dataset.rule);
+            }
+        });
+        
+        // Large runs are rendered a batch of rules per animation frame so the page
+        // stays responsive; a newer render (another run selected) abandons the old one
+        const RULES_PER_FRAME = 100;
+        let renderGeneration = 0;
+        let rendering = false;
+        let pendingExpanded = null;
         
-        function renderCategories(categories) {{
+        // Nodes each toggle works on, recorded as rows are rendered so clicks
+        // need no document lookups
+        const categoryNodes = new Map(); // category name -> {content, icon}
+        const ruleNodes = new Map(); // rule id -> {desc, viol, icon, list, listIcon}
+        
+        function renderCategories(categories) {
             const content = document.getElementById('content');
+            const progress = document.getElementById('render-progress');
             content.innerHTML = '';
+            categoryNodes.clear();
+            ruleNodes.clear();
             
-            // Sort categories by name
-            const sortedCategories = Object.entries(categories).sort((a, b) => a[0].localeCompare(b[0]));
+            const generation = ++renderGeneration;
+            const totalRules = categories.reduce((count, categoryData) => count + categoryData.rules.length, 0);
+            const batches = renderBatches(categories);
+            batches.next(); // Start the generator so the next call can hand it a fragment
+            let renderedRules = 0;
+            rendering = true;
+            pendingExpanded = null;
             
-            sortedCategories.forEach(([categoryName, categoryData]) => {{
-                const section = document.createElement('div');
-                section.className = 'category-section';
-                section.setAttribute('data-category', categoryName);
+            function renderNextBatch() {
+                if (generation !== renderGeneration) return;
                 
-                const hasFailures = categoryData.failed > 0;
+                // Each batch is assembled off-document and attached with a single insert
+                const fragment = document.createDocumentFragment();
+                const batch = batches.next(fragment);
+                content.appendChild(fragment);
                 
-                const header = document.createElement('div');
-                header.className = 'category-header' + (hasFailures ? ' failed' : '');
-                header.onclick = () => toggleCategory(categoryName);
+                if (batch.done) {
+                    rendering = false;
+                    progress.textContent = '';
+                    // Expand All / Collapse All clicked mid-render covers the late rules too
+                    if (pendingExpanded !== null) setAllExpanded(pendingExpanded);
+                    return;
+                }
+                renderedRules += batch.value;
+                progress.textContent = `Loading rules ${renderedRules}/${totalRules}…`;
+                requestAnimationFrame(renderNextBatch);
+            }
+            // The first batch renders right away, so small runs appear in one go.
+            // The active filter is a class on #content, so new results pick it up as is.
+            renderNextBatch();
+        }
+        
+        // Yields the number of rules rendered after every RULES_PER_FRAME rules. New
+        // sections go into the fragment passed to next(); rules continuing a section
+        // from an earlier batch go straight into its (collapsed) content div.
+        function* renderBatches(categories) {
+            let fragment = yield;
+            let batchRules = 0;
+            for (const categoryData of categories) {
+                const categoryName = categoryData.name;
+                const categorySlug = categoryName.replace(/\s+/g, '-');
+                const section = categoryTemplate.cloneNode(true);
+                section.setAttribute('data-category', categoryName);
                 
-                header.innerHTML = `
-                    <div class="category-title">
-                        <span class="expand-icon">▼</span>
-                        <span>${{categoryName}}</span>
-                    </div>
-                    <div class="category-stats">
-                        <span>✅ ${{categoryData.passed}}</span>
-                        <span>❌ ${{categoryData.failed}}</span>
-                        <span>📊 ${{categoryData.pass_rate.toFixed(1)}}%</span>
-                    </div>
-                `;
+                if (categoryData.failed > 0) {
+                    section.classList.add('has-failures');
+                    section.querySelector('.category-header').classList.add('failed');
+                }
+                
+                section.querySelector('.category-name').textContent = categoryName;
+                section.querySelector('.category-passed').textContent = `✅ ${categoryData.passed}`;
+                section.querySelector('.category-failed').textContent = `❌ ${categoryData.failed}`;
+                section.querySelector('.category-rate').textContent = `📊 ${categoryData.pass_rate.toFixed(1)}%`;
                 
-                const contentDiv = document.createElement('div');
-                contentDiv.className = 'category-content';
-                contentDiv.id = 'category-' + categoryName.replace(/\\s+/g, '-');
+                const contentDiv = section.querySelector('.category-content');
+                contentDiv.id = 'category-' + categorySlug;
+                categoryNodes.set(categoryName, { content: contentDiv, icon: section.querySelector('.expand-icon') });
+                fragment.appendChild(section);
                 
                 // Render rules
-                categoryData.rules.forEach((rule, ruleIndex) => {{
-                    const ruleDiv = document.createElement('div');
-                    ruleDiv.className = 'rule-item ' + rule.status;
-                    ruleDiv.setAttribute('data-status', rule.status);
-                    const ruleId = `rule-${{categoryName.replace(/\\s+/g, '-')}}-${{ruleIndex}}`;
-                    
-                    const hasDetails = rule.description || rule.violations.length > 0;
-                    const violationCount = rule.violations.length;
-                    const violationBadge = violationCount > 0 ? ` <span style="font-size: 12px; color: #E74C3C; font-weight: bold;">(${{violationCount}} Violation${{violationCount > 1 ? 's' : ''}})</span>` : '';
-                    
-                    let html = `
-                        <div class="rule-header" onclick="toggleRule('${{ruleId}}')">
-                            <div class="rule-name">
-                                ${{hasDetails ? '<span class="rule-expand-icon" id="icon-' + ruleId + '">▼</span>' : ''}}
-                                ${{rule.name}}${{violationBadge}}
-                                <span class="severity-badge severity-${{rule.severity}}">Severity ${{rule.severity}}</span>
-                            </div>
-                            <div class="rule-status ${{rule.status}}">${{rule.status}}</div>
-                        </div>
-                        <div class="rule-description" id="desc-${{ruleId}}">${{rule.description}}</div>
-                    `;
-                    
-                    if (rule.violations.length > 0) {{
-                        const objectCount = rule.violations.length;
-                        html += `
-                            <div class="violations-section" id="viol-${{ruleId}}">
-                                <div class="violations-header" onclick="toggleViolationsList('${{ruleId}}')">
-                                    <span class="violations-expand-icon" id="viol-icon-${{ruleId}}">▼</span>
-                                    🚨 ${{objectCount}} Object${{objectCount > 1 ? 's' : ''}} in Violation
-                                </div>
-                                <div class="violations-list" id="viol-list-${{ruleId}}">
-                        `;
-                        
-                        rule.violations.forEach(violation => {{
-                            html += `
-                                <div class="violation-item">
-                                    <div class="violation-object">📌 ${{violation.object}}</div>
-                                </div>
-                            `;
-                        }});
-                        
-                        html += '</div></div>';
-                    }}
-                    
-                    ruleDiv.innerHTML = html;
-                    contentDiv.appendChild(ruleDiv);
-                }});
+                for (let ruleIndex = 0; ruleIndex < categoryData.rules.length; ruleIndex++) {
+                    const rule = categoryData.rules[ruleIndex];
+                    contentDiv.appendChild(renderRule(rule, `rule-${categorySlug}-${ruleIndex}`));
+                    if (++batchRules === RULES_PER_FRAME) {
+                        fragment = yield batchRules;
+                        batchRules = 0;
+                    }
+                }
+            }
+        }
+        
+        function renderRule(rule, ruleId) {
+            const ruleDiv = ruleTemplate.cloneNode(true);
+            ruleDiv.classList.add(rule.status);
+            ruleDiv.setAttribute('data-status', rule.status);
+            ruleDiv.setAttribute('data-rule', ruleId);
+            
+            const violationCount = rule.violation_count;
+            const plural = violationCount > 1 ? 's' : '';
+            const nodes = { desc: null, viol: null, icon: null, list: null, listIcon: null };
+            ruleNodes.set(ruleId, nodes);
+            
+            const expandIcon = ruleDiv.querySelector('.rule-expand-icon');
+            if (rule.description || violationCount > 0) {
+                expandIcon.id = 'icon-' + ruleId;
+                nodes.icon = expandIcon;
+            } else {
+                expandIcon.remove();
+            }
+            
+            ruleDiv.querySelector('.rule-title').textContent = rule.name;
+            const violationBadge = ruleDiv.querySelector('.violation-badge');
+            if (violationCount > 0) {
+                violationBadge.textContent = `(${violationCount} Violation${plural})`;
+            } else {
+                violationBadge.remove();
+            }
+            
+            const severityBadge = ruleDiv.querySelector('.severity-badge');
+            severityBadge.classList.add('severity-' + rule.severity);
+            severityBadge.textContent = 'Severity ' + rule.severity;
+            
+            const status = ruleDiv.querySelector('.rule-status');
+            status.classList.add(rule.status);
+            status.textContent = rule.status;
+            
+            const description = ruleDiv.querySelector('.rule-description');
+            description.id = 'desc-' + ruleId;
+            description.textContent = rule.description;
+            nodes.desc = description;
+            
+            if (violationCount > 0) {
+                const violations = violationsTemplate.cloneNode(true);
+                violations.id = 'viol-' + ruleId;
+                nodes.viol = violations;
+                nodes.listIcon = violations.querySelector('.violations-expand-icon');
+                nodes.listIcon.id = 'viol-icon-' + ruleId;
+                violations.querySelector('.violations-title').textContent =
+                    `🚨 ${violationCount} Object${plural} in Violation`;
+                
+                const list = violations.querySelector('.violations-list');
+                list.id = 'viol-list-' + ruleId;
+                nodes.list = list;
+                rule.violations.objects.forEach(objectName => {
+                    const item = violationTemplate.cloneNode(true);
+                    item.querySelector('.violation-object').textContent = '📌 ' + objectName;
+                    list.appendChild(item);
+                });
                 
-                section.appendChild(header);
-                section.appendChild(contentDiv);
-                content.appendChild(section);
-            }});
+                ruleDiv.appendChild(violations);
+            }
             
-            // Apply current filter
-            applyFilter();
-        }}
+            return ruleDiv;
+        }
         
-        function toggleCategory(categoryName) {{
-            const contentId = 'category-' + categoryName.replace(/\\s+/g, '-');
-            const content = document.getElementById(contentId);
-            const section = content.parentElement;
-            const icon = section.querySelector('.expand-icon');
+        function toggleCategory(categoryName) {
+            const { content, icon } = categoryNodes.get(categoryName);
             
             content.classList.toggle('expanded');
             icon.classList.toggle('expanded');
-        }}
+        }
         
-        function toggleRule(ruleId) {{
-            const desc = document.getElementById('desc-' + ruleId);
-            const viol = document.getElementById('viol-' + ruleId);
-            const icon = document.getElementById('icon-' + ruleId);
+        function toggleRule(ruleId) {
+            const { desc, viol, icon } = ruleNodes.get(ruleId);
             
-            if (desc) {{
-                desc.classList.toggle('expanded');
-            }}
-            if (viol) {{
+            desc.classList.toggle('expanded');
+            if (viol) {
                 viol.classList.toggle('expanded');
-            }}
-            if (icon) {{
+            }
+            if (icon) {
                 icon.classList.toggle('expanded');
-            }}
-        }}
+            }
+        }
         
-        function toggleViolationsList(ruleId) {{
-            const list = document.getElementById('viol-list-' + ruleId);
-            const icon = document.getElementById('viol-icon-' + ruleId);
+        function toggleViolationsList(ruleId) {
+            const { list, listIcon } = ruleNodes.get(ruleId);
             
-            if (list) {{
+            if (list) {
                 list.classList.toggle('expanded');
-            }}
-            if (icon) {{
-                icon.classList.toggle('expanded');
-            }}
-        }}
+            }
+            if (listIcon) {
+                listIcon.classList.toggle('expanded');
+            }
+        }
         
-        function expandAll() {{
-            // Expand all categories
-            document.querySelectorAll('.category-content').forEach(el => {{
-                el.classList.add('expanded');
-            }});
-            document.querySelectorAll('.expand-icon').forEach(el => {{
-                el.classList.add('expanded');
-            }});
-            // Expand all rule descriptions
-            document.querySelectorAll('.rule-description').forEach(el => {{
-                el.classList.add('expanded');
-            }});
-            document.querySelectorAll('.rule-expand-icon').forEach(el => {{
-                el.textContent = '▲';
-            }});
-            // Expand all violation sections
-            document.querySelectorAll('.violations-section').forEach(el => {{
-                el.classList.add('expanded');
-            }});
-            // Expand all violation lists
-            document.querySelectorAll('.violations-list').forEach(el => {{
-                el.classList.add('expanded');
-            }});
-            document.querySelectorAll('.violations-expand-icon').forEach(el => {{
-                el.textContent = '▲';
-            }});
-        }}
+        // Live collections over the rendered results, so repeated expand/collapse
+        // clicks never re-query the document. Arrows are flipped by the CSS on
+        // their expanded class, like a single toggle does.
+        const expandTargets = [
+            'category-content', 'expand-icon', 'rule-description', 'rule-expand-icon',
+            'violations-section', 'violations-list', 'violations-expand-icon'
+        ].map(className => document.getElementsByClassName(className));
+        
+        function setAllExpanded(expanded) {
+            if (rendering) pendingExpanded = expanded;
+            expandTargets.forEach(elements => {
+                for (const el of elements) {
+                    el.classList.toggle('expanded', expanded);
+                }
+            });
+        }
         
-        function collapseAll() {{
-            // Collapse all categories
-            document.querySelectorAll('.category-content').forEach(el => {{
-                el.classList.remove('expanded');
-            }});
-            document.querySelectorAll('.expand-icon').forEach(el => {{
-                el.classList.remove('expanded');
-            }});
-            // Collapse all rule descriptions
-            document.querySelectorAll('.rule-description').forEach(el => {{
-                el.classList.remove('expanded');
-            }});
-            document.querySelectorAll('.rule-expand-icon').forEach(el => {{
-                el.textContent = '▼';
-            }});
-            // Collapse all violation sections
-            document.querySelectorAll('.violations-section').forEach(el => {{
-                el.classList.remove('expanded');
-            }});
-            // Collapse all violation lists
-            document.querySelectorAll('.violations-list').forEach(el => {{
-                el.classList.remove('expanded');
-            }});
-            document.querySelectorAll('.violations-expand-icon').forEach(el => {{
-                el.textContent = '▼';
-            }});
-        }}
+        function expandAll() {
+            setAllExpanded(true);
+        }
         
-        function filterRules(filter) {{
+        function collapseAll() {
+            setAllExpanded(false);
+        }
+        
+        function filterRules(filter) {
             currentFilter = filter;
             
             // Update button states
@@ -1046,35 +1022,336 @@ def create_multi_model_html(models_data, output_path):
             document.getElementById('filter-failed').classList.toggle('active', filter === 'failed');
             
             applyFilter();
-        }}
+        }
         
-        function applyFilter() {{
-            document.querySelectorAll('.rule-item').forEach(rule => {{
-                const status = rule.getAttribute('data-status');
-                
-                if (currentFilter === 'all') {{
-                    rule.style.display = '';
-                }} else if (currentFilter === status) {{
-                    rule.style.display = '';
-                }} else {{
-                    rule.style.display = 'none';
-                }}
-            }});
-            
-            // Hide empty categories
-            document.querySelectorAll('.category-section').forEach(section => {{
-                const visibleRules = Array.from(section.querySelectorAll('.rule-item')).filter(rule => {{
-                    return rule.style.display !== 'none';
-                }});
-                section.style.display = visibleRules.length > 0 ? '' : 'none';
-            }});
-        }}
+        function applyFilter() {
+            // Visibility is handled by the #content.show-<filter> CSS rules
+            document.getElementById('content').className = 'show-' + currentFilter;
+        }
     </script>
 </body>
-</html>"""
+</html>""")
+
+
+
+class Rule:
+    """A BPA rule (TRX UnitTest) with the properties the viewer shows"""
+    
+    __slots__ = ('id', 'name', 'description', 'severity', 'category', 'rule_id')
+    
+    def __init__(self, id, name, description, severity, category, rule_id):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.severity = severity
+        self.category = category
+        self.rule_id = rule_id
+
+
+class Violations:
+    """Objects flagged by a failed rule, which all share the rule's message"""
+    
+    __slots__ = ('message', 'objects')
+    
+    def __init__(self, message, objects):
+        self.message = message
+        self.objects = objects
+
+
+def _slots_to_dict(obj):
+    """json/orjson default hook that serializes Rule and Violations objects"""
+    if isinstance(obj, (Rule, Violations)):
+        return {name: getattr(obj, name) for name in obj.__slots__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def parse_trx_file(file_path):
+    """Parse TRX file and extract test run metadata and results
+    
+    The file is streamed with iterparse in a single pass; each UnitTest and
+    UnitTestResult element is cleared once consumed, so memory stays flat
+    however many rules the run contains.
+    """
+    try:
+        run_name = ''
+        start_time = finish_time = ''
+        outcome = 'Unknown'
+        counters = None
+        rules = {}
+        violations_by_rule = {}
+        
+        for _, elem in ET.iterparse(str(file_path), events=('end',), **_ITERPARSE_OPTIONS):
+            tag = elem.tag
+            
+            if tag == _Q_UNIT_TEST:
+                # Test definition (rule)
+                test_id = elem.get('id', '')
+                test_name = elem.get('name', '')
+                
+                properties = {}
+                for prop in elem.iter(_Q_PROPERTY):
+                    # Each <Property> holds <Key> then <Value>
+                    if len(prop) >= 2:
+                        properties[prop[0].text] = prop[1].text
+                
+                rules[test_id] = Rule(
+                    id=test_id,
+                    name=test_name,
+                    description=properties.get('Description', ''),
+                    severity=int(properties.get('Severity', 1)),
+                    # A handful of categories repeat across every rule; share one string each
+                    category=sys.intern(properties.get('Category', 'Unknown')),
+                    rule_id=properties.get('RuleID', ''),
+                )
+                elem.clear()
+            
+            elif tag == _Q_UNIT_TEST_RESULT:
+                # Test result (violations); passed results carry nothing we need
+                if elem.get('outcome', '') == 'Failed':
+                    test_id = elem.get('testId', '')
+                    
+                    # Extract error message and stack trace (violation details)
+                    # from UnitTestResult/Output/ErrorInfo
+                    output = elem.find(_Q_OUTPUT)
+                    if output is not None:
+                        error_info = output.find(_Q_ERROR_INFO)
+                        if error_info is not None:
+                            message_elem = error_info.find(_Q_MESSAGE)
+                            stack_trace_elem = error_info.find(_Q_STACK_TRACE)
+                            
+                            violation_count = ''
+                            if message_elem is not None and message_elem.text:
+                                violation_count = message_elem.text.strip()
+                            
+                            # Parse StackTrace to get individual violated objects
+                            if stack_trace_elem is not None and stack_trace_elem.text:
+                                stack_trace = stack_trace_elem.text.strip()
+                                # Parse "Objects in violation:\n  Object1\n  Object2\n..."
+                                _, marker, objects_text = stack_trace.partition(_OBJECTS_IN_VIOLATION)
+                                objects = [obj for obj in map(str.strip, objects_text.splitlines()) if obj]
+                                if marker and objects:
+                                    rule_violations = violations_by_rule.get(test_id)
+                                    if rule_violations is None:
+                                        violations_by_rule[test_id] = Violations(violation_count, objects)
+                                    else:
+                                        rule_violations.objects.extend(objects)
+                elem.clear()
+            
+            elif tag == _Q_TIMES:
+                start_time = elem.get('start', '')
+                finish_time = elem.get('finish', '')
+            
+            elif tag == _Q_COUNTERS:
+                counters = elem
+            
+            elif tag == _Q_RESULT_SUMMARY:
+                outcome = elem.get('outcome', 'Unknown')
+            
+            elif tag == _Q_TEST_RUN:
+                # The root element closes last
+                run_name = elem.get('name', '')
+        
+        # Extract model name from run name or filename
+        model_name = ''
+        if run_name:
+            # Extract from path like "C:\...\D&A - Inventory Insights.SemanticModel\definition"
+            match = _MODEL_RE.search(run_name)
+            if match:
+                model_name = match.group(1)
+        
+        if not model_name:
+            # Fallback to filename pattern: 20251114_1705_BPA_Inventory_Insights.trx
+            filename = Path(file_path).stem
+            parts = filename.split('_BPA_')
+            if len(parts) == 2:
+                model_name = parts[1].replace('_', ' ')
+        
+        stats = {
+            'total': int(counters.get('total', 0)) if counters is not None else 0,
+            'executed': int(counters.get('executed', 0)) if counters is not None else 0,
+            'passed': int(counters.get('passed', 0)) if counters is not None else 0,
+            'failed': int(counters.get('failed', 0)) if counters is not None else 0,
+            'inconclusive': int(counters.get('inconclusive', 0)) if counters is not None else 0,
+            'notExecuted': int(counters.get('notExecuted', 0)) if counters is not None else 0,
+        }
+        
+        # Calculate pass rate
+        pass_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
+        
+        return {
+            'model_name': model_name,
+            'file_name': Path(file_path).name,
+            'start_time': start_time,
+            'finish_time': finish_time,
+            'outcome': outcome,
+            'stats': stats,
+            'pass_rate': pass_rate,
+            'rules': rules,
+            'violations': violations_by_rule
+        }
+        
+    except Exception as e:
+        print(f"    ✗ Error parsing {Path(file_path).name}: {e}")
+        return None
+
+
+def extract_object_name(violation_msg):
+    """Extract object name from violation message"""
+    # Try to extract object name from common patterns
+    # Pattern 1: "Object: TableName.ColumnName"
+    match = _OBJECT_RE.search(violation_msg)
+    if match:
+        return match.group(1).strip()
+    
+    # Pattern 2: Look for table[column] pattern
+    match = _QUOTED_COLUMN_RE.search(violation_msg)
+    if match:
+        return f"{match.group(1)}.{match.group(2)}"
     
+    # Pattern 3: Look for table.column pattern
+    match = _DOTTED_NAME_RE.search(violation_msg)
+    if match:
+        return f"{match.group(1)}.{match.group(2)}"
+    
+    # Return first 50 chars if no pattern matches
+    return violation_msg[:50] + '...' if len(violation_msg) > 50 else violation_msg
+
+
+def prepare_visualization_data(trx_data):
+    """Prepare data structure for visualization"""
+    rules = trx_data['rules']
+    violations = trx_data['violations']
+    
+    # Group rules by category, tallying each category's results as we go
+    category_stats = {}
+    for rule_id, rule in rules.items():
+        stats = category_stats.get(rule.category)
+        if stats is None:
+            stats = category_stats[rule.category] = {
+                'total': 0,
+                'passed': 0,
+                'failed': 0,
+                'pass_rate': 0,
+                'rules': []
+            }
+        
+        # Get violations for this rule (None if it passed)
+        rule_violations = violations.get(rule_id)
+        violation_count = len(rule_violations.objects) if rule_violations else 0
+        
+        stats['total'] += 1
+        if violation_count:
+            stats['failed'] += 1
+        else:
+            stats['passed'] += 1
+        
+        stats['rules'].append({
+            'id': rule_id,
+            'name': rule.name,
+            'description': rule.description,
+            'severity': rule.severity,
+            'rule_id': rule.rule_id,
+            'status': 'failed' if violation_count else 'passed',
+            'violation_count': violation_count,
+            'violations': rule_violations
+        })
+    
+    # Ship categories as a list already in display order (by name, ignoring case)
+    categories = []
+    for name in sorted(category_stats, key=str.casefold):
+        stats = category_stats[name]
+        # Every category holds at least one rule, so total is never zero
+        stats['pass_rate'] = stats['passed'] / stats['total'] * 100
+        categories.append({'name': name, **stats})
+    
+    return {
+        'categories': categories,
+        'stats': trx_data['stats'],
+        'pass_rate': trx_data['pass_rate']
+    }
+
+
+def find_trx_files(root):
+    """Recursively find all .trx files under root
+    
+    os.walk lists each directory once with scandir and only file names that
+    match become Path objects. The extension check follows the platform's
+    case rules, as rglob does.
+    """
+    trx_files = []
+    for dir_path, _, file_names in os.walk(root):
+        for name in file_names:
+            if os.path.normcase(name).endswith('.trx'):
+                trx_files.append(Path(dir_path, name))
+    return trx_files
+
+
+def load_trx_file(trx_file):
+    """Parse a TRX file and prepare its viewer entry (runs in a worker process)
+    
+    Returns None if the file could not be parsed.
+    """
+    trx_data = parse_trx_file(trx_file)
+    if not trx_data:
+        return None
+    
+    return {
+        'model_name': trx_data['model_name'],
+        'file_name': trx_data['file_name'],
+        'data': prepare_visualization_data(trx_data)
+    }
+
+
+def create_multi_model_html(models_data, output_path):
+    """Create an interactive HTML with dropdown to select BPA results"""
+    
+    # Dropdown index of every run; the full results are written separately below
+    runs_index = {
+        key: {
+            'model_name': entry['model_name'],
+            'file_name': entry['file_name'],
+            'pass_rate': entry['data']['pass_rate']
+        }
+        for key, entry in models_data.items()
+    }
+    # Embedded as a string for JSON.parse, which engines parse faster than the
+    # equivalent object literal; '</' is escaped so a model name can't end the script
+    index_json = json.dumps(_json_dumps(runs_index)).replace('</', '<\\/')
+    
+    # Dropdown orders for both version modes, most recent file first. The
+    # latest run of a model is the one with the greatest file key.
+    latest_by_model = {}
+    for key, entry in models_data.items():
+        model_name = entry['model_name']
+        if model_name not in latest_by_model or key > latest_by_model[model_name]:
+            latest_by_model[model_name] = key
+    latest_keys_json = _json_dumps(sorted(latest_by_model.values(), reverse=True))
+    all_keys_json = _json_dumps(sorted(models_data, reverse=True))
+    css = _minify_css(_CSS)
+    
+    # The page is written piece by piece (static head, one data block per run, the
+    # run index, static viewer script), so the potentially large results are never
+    # copied into one combined HTML string
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.write(_HTML_HEAD)
+        f.write(css)
+        f.write(_HTML_BODY)
+        for key, entry in models_data.items():
+            blob = base64.b64encode(gzip.compress(_json_dumps(entry['data']).encode('utf-8'))).decode('ascii')
+            f.write(
+                f'<script type="application/octet-stream" class="run-data" '
+                f'data-run="{html.escape(key, quote=True)}">{blob}</script>\n'
+            )
+        # Run index for the dropdown and the dropdown keys per version mode,
+        # sorted most recent first; the viewer script reads these globals
+        f.write(
+            '<script type="text/javascript">\n'
+            f'const modelsData = JSON.parse({index_json});\n'
+            f'const LATEST_KEYS = {latest_keys_json};\n'
+            f'const ALL_KEYS = {all_keys_json};\n'
+            '</script>\n'
+        )
+        f.write(_HTML_TAIL)
     
     print(f"✓ Multi-model BPA viewer saved to: {output_path}")
 
@@ -1119,7 +1396,7 @@ Examples:
     # Find TRX files recursively if input is a directory
     if input_path.is_dir():
         print(f"🔍 Scanning for BPA TRX files in: {input_path}")
-        trx_files = list(input_path.rglob("*.trx"))
+        trx_files = find_trx_files(input_path)
     elif input_path.is_file() and input_path.suffix == '.trx':
         trx_files = [input_path]
         input_path = input_path.parent
@@ -1134,32 +1411,40 @@ Examples:
     
     print(f"Found {len(trx_files)} BPA result file(s)")
     
+    trx_files.sort(reverse=True)  # Most recent first
+    
+    if len(trx_files) > 1:
+        # Files are independent and CPU-bound to parse, so load them in parallel;
+        # results are still collected in sorted order so the dropdown order is stable
+        executor = ProcessPoolExecutor(max_workers=min(len(trx_files), os.cpu_count() or 1))
+        loaders = [executor.submit(load_trx_file, trx_file).result for trx_file in trx_files]
+    else:
+        executor = None
+        loaders = [functools.partial(load_trx_file, trx_files[0])]
+    
     models_data = {}
     
-    for trx_file in sorted(trx_files, reverse=True):  # Most recent first
-        print(f"  Processing: {trx_file.name}")
-        
-        try:
-            trx_data = parse_trx_file(trx_file)
+    try:
+        for trx_file, load in zip(trx_files, loaders):
+            print(f"  Processing: {trx_file.name}")
             
-            if trx_data:
-                viz_data = prepare_visualization_data(trx_data)
-                
-                # Use filename as unique key
-                file_key = trx_file.stem
+            try:
+                entry = load()
                 
-                models_data[file_key] = {
-                    'model_name': trx_data['model_name'],
-                    'file_name': trx_data['file_name'],
-                    'data': viz_data
-                }
-                
-                pass_rate = viz_data['pass_rate']
-                print(f"    ✓ {viz_data['stats']['total']} rules, {pass_rate:.1f}% pass rate")
-            else:
-                print(f"    ⚠ Could not parse file")
-        except Exception as e:
-            print(f"    ✗ Error: {e}")
+                if entry:
+                    # Use filename as unique key
+                    models_data[trx_file.stem] = entry
+                    
+                    viz_data = entry['data']
+                    pass_rate = viz_data['pass_rate']
+                    print(f"    ✓ {viz_data['stats']['total']} rules, {pass_rate:.1f}% pass rate")
+                else:
+                    print(f"    ⚠ Could not parse file")
+            except Exception as e:
+                print(f"    ✗ Error: {e}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     if not models_data:
         print("No valid BPA results found.")